@@ -0,0 +1,271 @@
+"""
+Набор бенчмарков для операций Rational и Complex.
+
+Запуск:
+    python -m benchmarks.bench_n -o bench.json
+    python -m benchmarks.bench_n --baseline bench.json --threshold 0.1
+
+Для каждой операции записывается время (нс на операцию), пиковый объём памяти за вызов
+(peak_bytes, включая временные объекты) и число блоков памяти, оставшихся занятыми после вызова
+(retained_blocks: результат и всё, на что он ссылается; временные объекты сюда не входят).
+При сравнении с базовым файлом процесс завершается с кодом 1, если какая-либо операция
+замедлилась больше порога или операция из базового файла отсутствует в текущем запуске.
+"""
+import argparse
+import json
+import platform
+import sys
+import time
+import timeit
+import tracemalloc
+from src.rational_n import Rational
+from src.complex_n import Complex
+from src.contfrac_n import best_approximations
+
+BIG = 10**40 + 7
+BIG_RATIONAL_A = Rational(BIG, 3 * 10**39 + 1)
+BIG_RATIONAL_B = Rational(BIG + 2, 7 * 10**38 + 3)
+SMALL_RATIONAL_A = Rational(3, 4)
+SMALL_RATIONAL_B = Rational(5, 7)
+SMALL_COMPLEX_A = Complex(Rational(1, 2), Rational(-3, 4))
+SMALL_COMPLEX_B = Complex(Rational(2, 3), Rational(5, 6))
+BIG_COMPLEX_A = Complex(BIG_RATIONAL_A, BIG_RATIONAL_B)
+BIG_COMPLEX_B = Complex(BIG_RATIONAL_B, -BIG_RATIONAL_A)
+FLOATS = [k / 7 + 0.001 * k for k in range(1000)]
+
+
+def _harmonic(n: int) -> Rational:
+    """
+    Сумма 1 + 1/2 + ... + 1/n: рост знаменателя при многократном сложении.
+    """
+    total = Rational(0)
+    for k in range(1, n + 1):
+        total = total + Rational(1, k)
+    return total
+
+
+def _iterate_quadratic(steps: int) -> Complex:
+    """
+    Итерация z = z * z + c с присваиванием на месте.
+    """
+    z = Complex(0)
+    c = Complex(Rational(1, 4), Rational(1, 8))
+    for _ in range(steps):
+        z *= z
+        z += c
+    return z
+
+
+def _copy(value: Complex) -> Complex:
+    """
+    Копия комплексного числа для операций с присваиванием на месте.
+    """
+    return Complex(value.real, value.imagine)
+
+
+def _iadd(a, b):
+    a += b
+    return a
+
+
+def _isub(a, b):
+    a -= b
+    return a
+
+
+def _imul(a, b):
+    a *= b
+    return a
+
+
+def _itruediv(a, b):
+    a /= b
+    return a
+
+
+def _cases() -> dict:
+    """
+    Возвращает словарь "имя -> функция без аргументов" для всех измеряемых операций.
+    """
+    cases = {
+        'rational.init.int': lambda: Rational(6, 8),
+        'rational.init.bigint': lambda: Rational(BIG * 6, BIG * 8),
+        'rational.init.float': lambda: Rational(0.1),
+        'rational.init.float_big': lambda: Rational(1.2345678901234567e300),
+    }
+    for size, a, b in (('small', SMALL_RATIONAL_A, SMALL_RATIONAL_B), ('big', BIG_RATIONAL_A, BIG_RATIONAL_B)):
+        cases.update({
+            f'rational.add.{size}': lambda a=a, b=b: a + b,
+            f'rational.add_int.{size}': lambda a=a: a + 3,
+            f'rational.sub.{size}': lambda a=a, b=b: a - b,
+            f'rational.mul.{size}': lambda a=a, b=b: a * b,
+            f'rational.truediv.{size}': lambda a=a, b=b: a / b,
+            f'rational.truediv_int.{size}': lambda a=a: a / 7,
+            f'rational.neg.{size}': lambda a=a: -a,
+            f'rational.abs.{size}': lambda a=a: abs(a),
+            f'rational.eq.{size}': lambda a=a, b=b: a == b,
+            f'rational.float.{size}': lambda a=a: float(a),
+            f'rational.str.{size}': lambda a=a: str(a),
+            f'rational.repr.{size}': lambda a=a: repr(a),
+        })
+    cases.update({
+        'complex.init.int': lambda: Complex(1, 2),
+        'complex.init.float': lambda: Complex(0.5, -0.25),
+    })
+    for size, a, b in (('small', SMALL_COMPLEX_A, SMALL_COMPLEX_B), ('big', BIG_COMPLEX_A, BIG_COMPLEX_B)):
+        cases.update({
+            f'complex.add.{size}': lambda a=a, b=b: a + b,
+            f'complex.radd.{size}': lambda a=a: 3 + a,
+            f'complex.sub.{size}': lambda a=a, b=b: a - b,
+            f'complex.rsub.{size}': lambda a=a: 3 - a,
+            f'complex.mul.{size}': lambda a=a, b=b: a * b,
+            f'complex.rmul.{size}': lambda a=a: 3 * a,
+            f'complex.truediv.{size}': lambda a=a, b=b: a / b,
+            f'complex.truediv_int.{size}': lambda a=a: a / 3,
+            f'complex.rtruediv.{size}': lambda a=a: 3 / a,
+            f'complex.iadd.{size}': lambda a=a, b=b: _iadd(_copy(a), b),
+            f'complex.isub.{size}': lambda a=a, b=b: _isub(_copy(a), b),
+            f'complex.imul.{size}': lambda a=a, b=b: _imul(_copy(a), b),
+            f'complex.itruediv.{size}': lambda a=a, b=b: _itruediv(_copy(a), b),
+            f'complex.neg.{size}': lambda a=a: -a,
+            f'complex.abs.{size}': lambda a=a: abs(a),
+            f'complex.eq.{size}': lambda a=a, b=b: a == b,
+            f'complex.ne.{size}': lambda a=a, b=b: a != b,
+            f'complex.arg.{size}': lambda a=a: a.arg(),
+            f'complex.str.{size}': lambda a=a: str(a),
+            f'complex.pow16.{size}': lambda a=a: a ** 16,
+        })
+    cases.update({
+        'complex.pow256.small': lambda: SMALL_COMPLEX_A ** 256,
+        'workload.harmonic200': lambda: _harmonic(200),
+        'workload.quadratic_iter8': lambda: _iterate_quadratic(8),
+        'contfrac.best_approximations.1000': lambda: best_approximations(FLOATS),
+        'contfrac.limit_denominator.big': lambda: BIG_RATIONAL_A.limit_denominator(1000),
+    })
+    return cases
+
+
+def _measure_memory(func) -> tuple[int, int]:
+    """
+    Измеряет память одного вызова.
+    :return: Кортеж (пиковый прирост занятой памяти в байтах за время вызова,
+             число блоков, оставшихся занятыми после вызова, — нетто, а не число выделений).
+    """
+    tracemalloc.start()
+    try:
+        before = tracemalloc.take_snapshot()
+        tracemalloc.reset_peak()
+        start, _ = tracemalloc.get_traced_memory()
+        result = func()
+        _, peak = tracemalloc.get_traced_memory()
+        after = tracemalloc.take_snapshot()
+    finally:
+        tracemalloc.stop()
+    own = (tracemalloc.Filter(False, tracemalloc.__file__), tracemalloc.Filter(False, __file__))
+    after, before = after.filter_traces(own), before.filter_traces(own)
+    blocks = sum(stat.count_diff for stat in after.compare_to(before, 'filename'))
+    del result
+    return peak - start, max(blocks, 0)
+
+
+def run(filter_text: str | None = None, min_time: float = 0.2, repeat: int = 3) -> dict:
+    """
+    Запускает бенчмарки.
+    :param filter_text: Подстрока имени; запускаются только совпадающие операции.
+    :param min_time: Минимальная длительность одного замера в секундах.
+    :param repeat: Число замеров; берётся лучший.
+    :return: Результаты в формате, пригодном для JSON.
+    """
+    results = {}
+    for name, func in _cases().items():
+        if filter_text and filter_text not in name:
+            continue
+        timer = timeit.Timer(func)
+        loops = 1
+        while True:
+            elapsed = timer.timeit(loops)
+            if elapsed >= min_time or loops >= 10**7:
+                break
+            loops *= 10 if elapsed < min_time / 10 else 2
+        best = min([elapsed] + timer.repeat(repeat - 1, loops)) if repeat > 1 else elapsed
+        peak_bytes, retained_blocks = _measure_memory(func)
+        results[name] = {
+            'ns_per_op': best / loops * 1e9,
+            'loops': loops,
+            'peak_bytes': peak_bytes,
+            'retained_blocks': retained_blocks,
+        }
+    return {
+        'meta': {
+            'python': platform.python_version(),
+            'implementation': platform.python_implementation(),
+            'machine': platform.machine(),
+            'timestamp': time.strftime('%Y-%m-%dT%H:%M:%S'),
+        },
+        'results': results,
+    }
+
+
+def compare(current: dict, baseline: dict, threshold: float = 0.1) -> list[tuple[str, float, float]]:
+    """
+    Сравнивает результаты с базовыми.
+    :param current: Текущие результаты run().
+    :param baseline: Базовые результаты run().
+    :param threshold: Допустимое относительное замедление (0.1 = 10%).
+    :return: Список регрессий (имя, базовое время, текущее время) в нс на операцию.
+    """
+    regressions = []
+    for name, stats in current['results'].items():
+        base = baseline['results'].get(name)
+        if base is None:
+            continue
+        if stats['ns_per_op'] > base['ns_per_op'] * (1 + threshold):
+            regressions.append((name, base['ns_per_op'], stats['ns_per_op']))
+    return regressions
+
+
+def missing_cases(current: dict, baseline: dict, filter_text: str | None = None) -> list[str]:
+    """
+    Находит операции из базового файла, которых нет в текущих результатах
+    (например, после переименования или удаления бенчмарка).
+    :param current: Текущие результаты run().
+    :param baseline: Базовые результаты run().
+    :param filter_text: Фильтр текущего запуска; операции, не подходящие под него, не учитываются.
+    :return: Отсортированный список имён.
+    """
+    return sorted(name for name in baseline['results']
+                  if name not in current['results'] and (not filter_text or filter_text in name))
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description='Benchmarks for Rational and Complex.')
+    parser.add_argument('-o', '--output', help='write results to this JSON file')
+    parser.add_argument('-b', '--baseline', help='compare against this JSON file')
+    parser.add_argument('-t', '--threshold', type=float, default=0.1, help='allowed slowdown (default 0.1)')
+    parser.add_argument('-k', '--filter', help='run only benchmarks whose name contains this text')
+    parser.add_argument('--min-time', type=float, default=0.2, help='seconds per measurement')
+    parser.add_argument('--repeat', type=int, default=3, help='measurements per benchmark')
+    args = parser.parse_args(argv)
+
+    current = run(args.filter, args.min_time, args.repeat)
+    for name, stats in current['results'].items():
+        print(f"{name:32} {stats['ns_per_op']:12.1f} ns  {stats['peak_bytes']:8d} B  {stats['retained_blocks']:5d} blk")
+    if args.output:
+        with open(args.output, 'w') as f:
+            json.dump(current, f, indent=2)
+    if args.baseline:
+        with open(args.baseline) as f:
+            baseline = json.load(f)
+        regressions = compare(current, baseline, args.threshold)
+        for name, before, after in regressions:
+            print(f'REGRESSION {name}: {before:.1f} ns -> {after:.1f} ns ({after / before - 1:+.1%})')
+        missing = missing_cases(current, baseline, args.filter)
+        for name in missing:
+            print(f'MISSING {name}: present in baseline but not measured')
+        if regressions or missing:
+            return 1
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -1,5 +1,62 @@
 import math
+import numbers
+import re
+import sys
 from fractions import Fraction
+from src.rational_n import Rational, _coerce, _parse_rational
+
+_TERM = r'\d+(?:\s*/\s*\d+)?'
+_COMPLEX_RE = re.compile(
+    r'\s*(?:(?P<rs>[+-]?)\s*(?P<re>' + _TERM + r')(?:\s*(?P<is>[+-])\s*(?P<im>' + _TERM + r')?\s*i)?'
+    r'|(?P<os>[+-]?)\s*(?P<oi>' + _TERM + r')?\s*i)\s*'
+)
+_COMPLEX_REPR_RE = re.compile(
+    r'\s*Complex\(\s*(?:real\s*=\s*)?(?P<re>[^,]+?)\s*,\s*(?:imagine\s*=\s*)?(?P<im>[^)]+?)\s*\)\s*'
+)
+
+
+def _signed_term(sign: str | None, term: str | None) -> tuple[int, int]:
+    """
+    Превращает знак и запись дроби без знака в пару (числитель, знаменатель).
+    Отсутствующая запись означает единицу (например, "i" или "-i").
+    """
+    numerator, denominator = _parse_rational(term) if term is not None else (1, 1)
+    return (-numerator if sign == '-' else numerator), denominator
+
+
+def _parse_complex(text: str) -> tuple[tuple[int, int], tuple[int, int]]:
+    """
+    Разбирает строку вида "1/2 - 3/4i", "5", "-i" или "Complex(real=1/2, imagine=-3/4)".
+    :param text: Строка для разбора.
+    :return: Пары (числитель, знаменатель) действительной и мнимой частей без упрощения.
+    :raises ValueError: Если строка не является записью комплексного числа.
+    """
+    match = _COMPLEX_RE.fullmatch(text)
+    if match is not None:
+        if match.group('re') is not None:
+            real = _signed_term(match.group('rs'), match.group('re'))
+            if match.group('is') is None:
+                return real, (0, 1)
+            return real, _signed_term(match.group('is'), match.group('im'))
+        return (0, 1), _signed_term(match.group('os'), match.group('oi'))
+    match = _COMPLEX_REPR_RE.fullmatch(text)
+    if match is not None:
+        try:
+            return _parse_rational(match.group('re')), _parse_rational(match.group('im'))
+        except ValueError:
+            pass
+    raise ValueError(f'invalid complex literal: {text!r}')
+
+
+def _coerce_complex(other):
+    """
+    Приводит встроенный complex к Complex, а Fraction — к Rational; остальные значения не меняет.
+    """
+    if isinstance(other, complex):
+        return Complex.from_complex(other)
+    return _coerce(other)
+
+
 class Complex:
     """
     Класс Complex представляет комплексное число в виде действительной и мнимой частей.
@@ -14,6 +71,37 @@ class Complex:
         self._real = Rational(real) if not isinstance(real, Rational) else real
         self._imagine = Rational(imagine) if not isinstance(imagine, Rational) else imagine
 
+    @classmethod
+    def from_string(cls, text: str):
+        """
+        Создаёт комплексное число из строкового представления.
+        Принимает формат __str__ ("1/2 - 3/4i", "5", "-i") и формат __repr__
+        ("Complex(real=1/2, imagine=-3/4)").
+        :param text: Строка для разбора.
+        :return: Новое комплексное число.
+        :raises ValueError: Если строка некорректна или знаменатель равен нулю.
+        """
+        real, imagine = _parse_complex(text)
+        return cls(Rational(*real), Rational(*imagine))
+
+    @classmethod
+    def from_complex(cls, value: complex, max_denominator: int | None = None):
+        """
+        Создаёт комплексное число из встроенного complex.
+        :param value: Исходное число complex.
+        :param max_denominator: Наибольший знаменатель частей; None (по умолчанию) — точное значение.
+        :return: Новое комплексное число.
+        """
+        return cls(Rational.from_float(value.real, max_denominator),
+                   Rational.from_float(value.imag, max_denominator))
+
+    def __reduce__(self):
+        """
+        Компактное представление для pickle: четыре целых числа вместо трёх объектов.
+        """
+        return _complex_from_parts, (self.real.numerator, self.real.denominator,
+                                     self.imagine.numerator, self.imagine.denominator)
+
     @property
     def real(self):
         """
@@ -46,6 +134,28 @@ class Complex:
         """
         self._imagine = Rational(value) if not isinstance(value, Rational) else value
 
+    @property
+    def imag(self):
+        """
+        Синоним imagine для совместимости с complex и numbers.Complex.
+        :return: Мнимая часть.
+        """
+        return self._imagine
+
+    def conjugate(self):
+        """
+        Возвращает комплексно-сопряжённое число.
+        :return: Сопряжённое число.
+        """
+        return self.__class__(self.real, -self.imagine)
+
+    def __complex__(self):
+        """
+        Преобразует комплексное число во встроенный complex.
+        :return: Значение числа как complex.
+        """
+        return complex(float(self.real), float(self.imagine))
+
     def __str__(self):
         """
         Возвращает строковое представление комплексного числа.
@@ -70,6 +180,7 @@ class Complex:
         :param other: Второе слагаемое.
         :return: Результат сложения.
         """
+        other = _coerce_complex(other)
         if isinstance(other, self.__class__):
             return self.__class__(self.real + other.real, self.imagine + other.imagine)
         if isinstance(other, (int, float, Rational)):
@@ -90,6 +201,7 @@ class Complex:
         :param other: Вычитаемое.
         :return: Результат вычитания.
         """
+        other = _coerce_complex(other)
         if isinstance(other, self.__class__):
             return self.__class__(self.real - other.real, self.imagine - other.imagine)
         if isinstance(other, (int, float, Rational)):
@@ -102,7 +214,12 @@ class Complex:
         :param other: Уменьшаемое.
         :return: Результат вычитания.
         """
-        return self.__class__(other) - self
+        other = _coerce_complex(other)
+        if isinstance(other, Complex):
+            return other - self
+        if isinstance(other, (int, float, Rational)):
+            return self.__class__(other) - self
+        return NotImplemented
 
     def __mul__(self, other):
         """
@@ -110,6 +227,7 @@ class Complex:
         :param other: Множитель.
         :return: Результат умножения.
         """
+        other = _coerce_complex(other)
         if isinstance(other, self.__class__):
             real = self.real * other.real - self.imagine * other.imagine
             imagine = self.real * other.imagine + self.imagine * other.real
@@ -133,6 +251,7 @@ class Complex:
         :return: Результат деления.
         :raises ZeroDivisionError: Если делитель равен нулю.
         """
+        other = _coerce_complex(other)
         if isinstance(other, self.__class__):
             denom = float(other.real) ** 2 + float(other.imagine) ** 2
             if denom == 0:
@@ -152,26 +271,49 @@ class Complex:
         :param other: Делимое.
         :return: Результат деления.
         """
-        return self.__class__(other) / self
+        other = _coerce_complex(other)
+        if isinstance(other, Complex):
+            return other / self
+        if isinstance(other, (int, float, Rational)):
+            return self.__class__(other) / self
+        return NotImplemented
 
     def __eq__(self, other):
         """
         Проверяет равенство двух комплексных чисел.
-        :param other: Второе число.
+        :param other: Второе число: Complex, complex или действительное число (int, float, Rational, Fraction).
         :return: True, если числа равны, иначе False.
         """
+        other = _coerce_complex(other)
         if isinstance(other, self.__class__):
             return self.real == other.real and self.imagine == other.imagine
+        if isinstance(other, (int, float, Rational)):
+            return self.real == other and self.imagine == 0
         return NotImplemented
 
+    def __hash__(self):
+        """
+        Вычисляет хеш по тому же правилу, что и complex: число, равное complex или
+        действительному числу, имеет тот же хеш.
+        :return: Хеш числа.
+        """
+        width = sys.hash_info.width
+        result = hash(self.real) + sys.hash_info.imag * hash(self.imagine)
+        # Переполнение машинного слова, как в CPython
+        result = (result + (1 << (width - 1))) % (1 << width) - (1 << (width - 1))
+        return -2 if result == -1 else result
+
     def __ne__(self, other):
         """
         Проверяет неравенство двух комплексных чисел.
-        :param other: Второе число.
+        :param other: Второе число: Complex, complex или действительное число (int, float, Rational, Fraction).
         :return: True, если числа не равны, иначе False.
         """
+        other = _coerce_complex(other)
         if isinstance(other, self.__class__):
             return self.real != other.real or self.imagine != other.imagine
+        if isinstance(other, (int, float, Rational)):
+            return self.real != other or self.imagine != 0
         return NotImplemented
 
     def __abs__(self):
@@ -181,6 +323,13 @@ class Complex:
         """
         return (float(self.real) ** 2 + float(self.imagine) ** 2) ** 0.5
 
+    def norm2(self):
+        """
+        Вычисляет квадрат модуля комплексного числа точно, без перехода к float.
+        :return: Квадрат модуля как Rational.
+        """
+        return self.real * self.real + self.imagine * self.imagine
+
     def __pow__(self, n):
         """
         Выполняет возведение комплексного числа в степень.
@@ -194,17 +343,30 @@ class Complex:
         base = self
         while n > 0:
             if n % 2 == 1:
-                result *= base
-            base *= base
+                result = result * base
+            base = base * base
             n //= 2
         return result
 
+    def __rpow__(self, other):
+        """
+        Возводит число в комплексную степень.
+        :param other: Основание.
+        :return: Точный результат для действительного показателя и точного основания, иначе complex.
+        """
+        if self.imagine.numerator == 0 and isinstance(other, numbers.Real):
+            return other ** self.real
+        if isinstance(other, numbers.Complex):
+            return complex(other) ** complex(self)
+        return NotImplemented
+
     def __iadd__(self, other):
         """
         Выполняет сложение с присваиванием.
         :param other: Второе слагаемое.
         :return: Изменённый объект.
         """
+        other = _coerce_complex(other)
         if isinstance(other, self.__class__):
             self.real += other.real
             self.imagine += other.imagine
@@ -220,6 +382,7 @@ class Complex:
         :param other: Вычитаемое.
         :return: Изменённый объект.
         """
+        other = _coerce_complex(other)
         if isinstance(other, self.__class__):
             self.real -= other.real
             self.imagine -= other.imagine
@@ -235,6 +398,7 @@ class Complex:
         :param other: Множитель.
         :return: Изменённый объект.
         """
+        other = _coerce_complex(other)
         if isinstance(other, self.__class__):
             real = self.real * other.real - self.imagine * other.imagine
             imagine = self.real * other.imagine + self.imagine * other.real
@@ -254,6 +418,7 @@ class Complex:
         :return: Изменённый объект.
         :raises ZeroDivisionError: Если делитель равен нулю.
         """
+        other = _coerce_complex(other)
         if isinstance(other, self.__class__):
             denom = float(other.real) ** 2 + float(other.imagine) ** 2
             if denom == 0:
@@ -278,9 +443,28 @@ class Complex:
         """
         return self.__class__(-self.real, -self.imagine)
 
+    def __pos__(self):
+        """
+        Возвращает копию комплексного числа.
+        :return: Новое комплексное число с теми же частями.
+        """
+        return self.__class__(self.real, self.imagine)
+
     def arg(self):
         """
         Вычисляет аргумент комплексного числа (угол в радианах).
         :return: Аргумент комплексного числа.
         """
-        return math.atan2(float(self.imagine), float(self.real))
\ No newline at end of file
+        return math.atan2(float(self.imagine), float(self.real))
+
+
+def _complex_from_parts(real_numerator: int, real_denominator: int,
+                        imagine_numerator: int, imagine_denominator: int) -> Complex:
+    """
+    Восстанавливает Complex из несократимых частей без повторного упрощения.
+    """
+    return Complex(Rational._from_parts(real_numerator, real_denominator),
+                   Rational._from_parts(imagine_numerator, imagine_denominator))
+
+
+numbers.Complex.register(Complex)
@@ -0,0 +1,134 @@
+"""
+Цепные дроби для Rational и Complex: подходящие дроби и наилучшие рациональные приближения.
+
+Все вычисления ведутся в целых числах; float раскладывается точно через float.as_integer_ratio().
+"""
+from fractions import Fraction
+from typing import Iterator
+from src import rational_n
+from src.rational_n import Rational, DEFAULT_MAX_DENOMINATOR, _limit_ratio
+from src.complex_n import Complex
+
+
+def _ratio(value) -> tuple[int, int]:
+    """
+    Возвращает точное представление числа в виде (числитель, положительный знаменатель).
+    :raises TypeError: Если тип значения не поддерживается.
+    """
+    if isinstance(value, Rational):
+        return value.numerator, value.denominator
+    if isinstance(value, (int, float, Fraction)):
+        return value.as_integer_ratio()
+    raise TypeError(f'unsupported value type: {type(value).__name__}')
+
+
+def partial_quotients(value) -> Iterator[int]:
+    """
+    Лениво раскладывает число в цепную дробь [a0; a1, a2, ...].
+    :param value: Rational, Fraction, int или float.
+    :return: Генератор неполных частных.
+    """
+    n, d = _ratio(value)
+    while d:
+        a = n // d
+        yield a
+        n, d = d, n - a * d
+
+
+def convergents(value) -> Iterator[Rational]:
+    """
+    Лениво строит подходящие дроби p_k/q_k; последняя равна самому числу.
+    :param value: Rational, Fraction, int или float.
+    :return: Генератор подходящих дробей в виде несократимых Rational.
+    """
+    p0, q0, p1, q1 = 0, 1, 1, 0
+    for a in partial_quotients(value):
+        p0, q0, p1, q1 = p1, q1, a * p1 + p0, a * q1 + q0
+        yield Rational._from_parts(p1, q1)
+
+
+def _limit(value, ratio: tuple[int, int], max_denominator: int) -> tuple[int, int]:
+    """
+    Ограничивает знаменатель; float приближается через rational_n._float_to_ratio,
+    чтобы преобразование учитывалось инструментированием.
+    """
+    if isinstance(value, float):
+        return rational_n._float_to_ratio(value, max_denominator)
+    return _limit_ratio(*ratio, max_denominator)
+
+
+def best_approximation(value, max_denominator: int = DEFAULT_MAX_DENOMINATOR,
+                       tolerance=None) -> Rational:
+    """
+    Находит наилучшее рациональное приближение числа.
+    Без tolerance возвращает ближайшую дробь со знаменателем не больше max_denominator
+    (как Fraction.limit_denominator). С tolerance возвращает дробь с наименьшим знаменателем
+    и погрешностью не больше tolerance (среди подходящих и промежуточных дробей), а если такой
+    нет в пределах max_denominator — ближайшую дробь с ограниченным знаменателем.
+    :param value: Rational, Fraction, int или float.
+    :param max_denominator: Наибольший допустимый знаменатель.
+    :param tolerance: Допустимая абсолютная погрешность (необязательно).
+    :return: Несократимое рациональное число.
+    :raises ValueError: Если max_denominator меньше 1 или tolerance отрицательна.
+    """
+    n, d = _ratio(value)
+    if tolerance is not None:
+        if max_denominator < 1:
+            raise ValueError('max_denominator should be at least 1')
+        n_tol, d_tol = _ratio(tolerance)
+        if n_tol < 0:
+            raise ValueError('tolerance must be non-negative')
+        p0, q0, p1, q1 = 0, 1, 1, 0
+        rest_n, rest_d = n, d
+        while rest_d:
+            a = rest_n // rest_d
+            if q1:
+                # Промежуточные дроби (p0 + k*p1)/(q0 + k*q1), 1 <= k < a, приближаются к числу
+                # монотонно; погрешность (A - k*B)/(d*q) <= n_tol/d_tol даёт наименьшее k.
+                error0, error1 = abs(n * q0 - d * p0), abs(n * q1 - d * p1)
+                k = max(1, -((n_tol * d * q0 - error0 * d_tol) // (error1 * d_tol + n_tol * d * q1)))
+                if k < a:
+                    if q0 + k * q1 > max_denominator:
+                        break
+                    return Rational._from_parts(p0 + k * p1, q0 + k * q1)
+            p0, q0, p1, q1 = p1, q1, p0 + a * p1, q0 + a * q1
+            if q1 > max_denominator:
+                break
+            # |n/d - p1/q1| <= n_tol/d_tol без деления
+            if abs(n * q1 - p1 * d) * d_tol <= n_tol * d * q1:
+                return Rational._from_parts(p1, q1)
+            rest_n, rest_d = rest_d, rest_n - a * rest_d
+    return Rational._from_parts(*_limit(value, (n, d), max_denominator))
+
+
+def best_approximations(values, max_denominator: int = DEFAULT_MAX_DENOMINATOR) -> list[Rational]:
+    """
+    Приближает набор чисел с общим ограничением знаменателя.
+    Повторяющиеся значения вычисляются один раз.
+    :param values: Итерируемый набор float, int, Fraction или Rational.
+    :param max_denominator: Наибольший допустимый знаменатель.
+    :return: Список несократимых рациональных чисел в исходном порядке.
+    :raises ValueError: Если max_denominator меньше 1.
+    """
+    if max_denominator < 1:
+        raise ValueError('max_denominator should be at least 1')
+    cache = {}
+    results = []
+    for value in values:
+        ratio = _ratio(value)
+        parts = cache.get(ratio)
+        if parts is None:
+            parts = cache[ratio] = _limit(value, ratio, max_denominator)
+        results.append(Rational._from_parts(*parts))
+    return results
+
+
+def approximate_complex(value: Complex, max_denominator: int = DEFAULT_MAX_DENOMINATOR) -> Complex:
+    """
+    Ограничивает знаменатели обеих частей комплексного числа.
+    :param value: Комплексное число.
+    :param max_denominator: Наибольший допустимый знаменатель.
+    :return: Новое комплексное число.
+    """
+    return value.__class__(value.real.limit_denominator(max_denominator),
+                           value.imagine.limit_denominator(max_denominator))
@@ -0,0 +1,216 @@
+"""
+Необязательная инструментация Rational и Complex.
+
+Пока инструментация выключена, классы не изменяются и накладных расходов нет.
+При включении все публичные и специальные методы классов (включая classmethod и сеттеры
+свойств) временно подменяются обёртками, которые считают вызовы по типам, измеряют время _simplify (НОД) и преобразования float -> Rational,
+а также собирают гистограммы длины числителей и знаменателей в битах.
+
+    with profile() as p:
+        run_job()
+    print(p.snapshot['counts'])
+"""
+import functools
+import time
+from collections import Counter
+from contextlib import contextmanager
+from src import rational_n
+from src.rational_n import Rational
+from src.complex_n import Complex
+
+_counts = Counter()
+_numerator_bits = Counter()
+_denominator_bits = Counter()
+_timings = {'simplify_calls': 0, 'simplify_ns': 0, 'float_calls': 0, 'float_ns': 0}
+_originals = []
+_depth = 0
+
+
+def _bucket(value: int) -> int:
+    """
+    Возвращает корзину гистограммы: наименьшую степень двойки, не меньшую длины числа в битах.
+    """
+    bits = abs(value).bit_length()
+    return 0 if bits == 0 else 1 << (bits - 1).bit_length()
+
+
+def _counting(key: str, func):
+    """
+    Оборачивает метод счётчиком вызовов.
+    """
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        _counts[key] += 1
+        return func(*args, **kwargs)
+    return wrapper
+
+
+def _timed_simplify(func):
+    """
+    Оборачивает Rational._simplify: время НОД и гистограммы длины результата.
+    """
+    @functools.wraps(func)
+    def wrapper(self):
+        start = time.perf_counter_ns()
+        func(self)
+        _timings['simplify_ns'] += time.perf_counter_ns() - start
+        _timings['simplify_calls'] += 1
+        _numerator_bits[_bucket(self.numerator)] += 1
+        _denominator_bits[_bucket(self.denominator)] += 1
+    return wrapper
+
+
+def _timed_float(func):
+    """
+    Оборачивает преобразование float -> (числитель, знаменатель).
+    """
+    @functools.wraps(func)
+    def wrapper(*args):
+        start = time.perf_counter_ns()
+        result = func(*args)
+        _timings['float_ns'] += time.perf_counter_ns() - start
+        _timings['float_calls'] += 1
+        return result
+    return wrapper
+
+
+def _record_parts(func):
+    """
+    Оборачивает Rational._from_parts: значения, созданные без _simplify, тоже попадают в гистограммы.
+    """
+    @functools.wraps(func)
+    def wrapper(cls, numerator, denominator):
+        _numerator_bits[_bucket(numerator)] += 1
+        _denominator_bits[_bucket(denominator)] += 1
+        return func(cls, numerator, denominator)
+    return wrapper
+
+
+def _operations(cls) -> list[str]:
+    """
+    Возвращает имена всех публичных и специальных методов класса, а также свойств с сеттером.
+    Список строится по __dict__ класса, поэтому новые методы учитываются автоматически.
+    """
+    names = []
+    for name, attr in cls.__dict__.items():
+        if name.startswith('_') and not (name.startswith('__') and name.endswith('__')):
+            continue
+        if isinstance(attr, property):
+            if attr.fset is not None:
+                names.append(name)
+        elif isinstance(attr, (classmethod, staticmethod)) or callable(attr):
+            names.append(name)
+    return names
+
+
+def _wrap(attr, wrapper):
+    """
+    Применяет обёртку к функции, classmethod, staticmethod или сеттеру свойства.
+    """
+    if isinstance(attr, classmethod):
+        return classmethod(wrapper(attr.__func__))
+    if isinstance(attr, staticmethod):
+        return staticmethod(wrapper(attr.__func__))
+    if isinstance(attr, property):
+        return property(attr.fget, wrapper(attr.fset), attr.fdel, attr.__doc__)
+    return wrapper(attr)
+
+
+def _patch(owner, name: str, wrapper):
+    """
+    Подменяет атрибут и запоминает исходное значение для восстановления.
+    """
+    original = owner.__dict__[name]
+    _originals.append((owner, name, original))
+    setattr(owner, name, _wrap(original, wrapper))
+
+
+def enable():
+    """
+    Включает инструментацию. Вызовы могут быть вложенными: классы восстанавливаются
+    только после парного числа вызовов disable().
+    """
+    global _depth
+    _depth += 1
+    if _depth > 1:
+        return
+    for cls in (Rational, Complex):
+        for name in _operations(cls):
+            _patch(cls, name, functools.partial(_counting, f'{cls.__name__}.{name}'))
+    _patch(Rational, '_simplify', _timed_simplify)
+    _patch(Rational, '_from_parts', _record_parts)
+    _patch(rational_n, '_float_to_ratio', _timed_float)
+
+
+def disable():
+    """
+    Выключает инструментацию и возвращает исходные методы классов.
+    Собранные данные сохраняются до вызова reset().
+    """
+    global _depth
+    if _depth == 0:
+        return
+    _depth -= 1
+    if _depth > 0:
+        return
+    while _originals:
+        owner, name, original = _originals.pop()
+        setattr(owner, name, original)
+
+
+def is_enabled() -> bool:
+    """
+    :return: True, если инструментация включена.
+    """
+    return _depth > 0
+
+
+def reset():
+    """
+    Обнуляет все собранные данные.
+    """
+    _counts.clear()
+    _numerator_bits.clear()
+    _denominator_bits.clear()
+    for key in _timings:
+        _timings[key] = 0
+
+
+def snapshot() -> dict:
+    """
+    Возвращает копию собранных данных.
+    :return: Словарь с ключами counts, simplify_calls, simplify_ns, float_calls, float_ns,
+             numerator_bits и denominator_bits (гистограммы "корзина в битах -> число значений").
+    """
+    return {
+        'counts': dict(_counts),
+        **_timings,
+        'numerator_bits': dict(sorted(_numerator_bits.items())),
+        'denominator_bits': dict(sorted(_denominator_bits.items())),
+    }
+
+
+class Profile:
+    """
+    Результат профилирования блока кода; snapshot заполняется при выходе из блока.
+    """
+    def __init__(self):
+        self.snapshot = None
+
+
+@contextmanager
+def profile():
+    """
+    Контекстный менеджер: включает инструментацию на время блока и сохраняет снимок
+    в возвращаемом объекте Profile. Данные обнуляются, только если инструментация
+    ещё не была включена, чтобы не потерять данные внешнего enable().
+    """
+    if _depth == 0:
+        reset()
+    result = Profile()
+    enable()
+    try:
+        yield result
+    finally:
+        disable()
+        result.snapshot = snapshot()
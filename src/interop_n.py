@@ -0,0 +1,108 @@
+from array import array
+from src.rational_n import Rational
+from src.complex_n import Complex
+
+_INT_FORMATS = frozenset('bBhHiIlLqQnN')
+_FLOAT_FORMATS = frozenset(('d', 'Zd'))
+
+
+def _byte_view(buffer) -> tuple[memoryview, str]:
+    """
+    Возвращает побайтовое представление буфера и исходный формат элементов.
+    Для C-непрерывных буферов копирования нет; иначе данные копируются один раз.
+    :param buffer: Любой объект с буферным протоколом (array.array, numpy.ndarray, bytes...).
+    :return: Кортеж (memoryview формата 'B', формат элементов).
+    """
+    view = memoryview(buffer)
+    if not view.c_contiguous:
+        return memoryview(view.tobytes()), view.format
+    return view.cast('B'), view.format
+
+
+def _int_list(buffer) -> list[int]:
+    """
+    Читает целочисленный буфер в список int.
+    :raises TypeError: Если формат буфера не целочисленный.
+    """
+    raw, fmt = _byte_view(buffer)
+    if fmt.lstrip('@=') not in _INT_FORMATS:
+        raise TypeError(f'unsupported buffer format: {fmt!r}')
+    return raw.cast(fmt.lstrip('@=')).tolist()
+
+
+def complex_from_buffer(buffer, max_denominator: int | None = None) -> list[Complex]:
+    """
+    Создаёт список комплексных чисел из буфера complex128 (например, numpy.complex128)
+    или из буфера float64 с чередующимися действительными и мнимыми частями.
+    :param buffer: Объект с буферным протоколом.
+    :param max_denominator: Наибольший знаменатель частей; None (по умолчанию) — точные значения float.
+    :return: Список комплексных чисел.
+    :raises TypeError: Если формат буфера не поддерживается.
+    :raises ValueError: Если в буфере float64 нечётное число элементов.
+    """
+    raw, fmt = _byte_view(buffer)
+    if fmt.lstrip('@=') not in _FLOAT_FORMATS:
+        raise TypeError(f'unsupported buffer format: {fmt!r}')
+    values = raw.cast('d')
+    if len(values) % 2:
+        raise ValueError('float64 buffer must contain real/imagine pairs')
+    from_float = Rational.from_float
+    return [Complex(from_float(values[i], max_denominator), from_float(values[i + 1], max_denominator))
+            for i in range(0, len(values), 2)]
+
+
+def complex_to_buffer(values) -> array:
+    """
+    Упаковывает комплексные числа в array('d') с чередующимися действительными и мнимыми частями.
+    Результат можно без копирования открыть как numpy.frombuffer(buf, dtype=numpy.complex128).
+    :param values: Итерируемый набор Complex.
+    :return: Массив float64 длины 2 * len(values).
+    """
+    out = array('d')
+    for value in values:
+        out.append(float(value.real))
+        out.append(float(value.imagine))
+    return out
+
+
+def rational_from_buffers(numerators, denominators=None) -> list[Rational]:
+    """
+    Создаёт список рациональных чисел из целочисленных буферов числителей и знаменателей.
+    :param numerators: Буфер целых чисел (array('q'), numpy.int64 и т.п.).
+    :param denominators: Буфер знаменателей той же длины (по умолчанию все равны 1).
+    :return: Список рациональных чисел.
+    :raises TypeError: Если формат буфера не целочисленный.
+    :raises ValueError: Если длины буферов различаются или знаменатель равен нулю.
+    """
+    nums = _int_list(numerators)
+    if denominators is None:
+        return [Rational(n) for n in nums]
+    dens = _int_list(denominators)
+    if len(nums) != len(dens):
+        raise ValueError('numerators and denominators must have the same length')
+    return [Rational(n, m) for n, m in zip(nums, dens)]
+
+
+def rational_to_buffers(values) -> tuple[array, array]:
+    """
+    Упаковывает рациональные числа в два массива int64: числители и знаменатели.
+    :param values: Итерируемый набор Rational.
+    :return: Кортеж (числители, знаменатели) типа array('q').
+    :raises OverflowError: Если числитель или знаменатель не помещается в int64.
+    """
+    nums, dens = array('q'), array('q')
+    for value in values:
+        nums.append(value.numerator)
+        dens.append(value.denominator)
+    return nums, dens
+
+
+def complex_to_numpy(values):
+    """
+    Возвращает numpy-массив complex128, разделяющий память с результатом complex_to_buffer.
+    :param values: Итерируемый набор Complex.
+    :return: numpy.ndarray типа complex128.
+    :raises ImportError: Если numpy не установлен.
+    """
+    import numpy
+    return numpy.frombuffer(complex_to_buffer(values), dtype=numpy.complex128)
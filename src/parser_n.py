@@ -0,0 +1,88 @@
+from typing import Iterable, Iterator
+from src.rational_n import Rational
+from src.complex_n import Complex
+
+
+class ParseError(ValueError):
+    """
+    Ошибка разбора строки потока с указанием номера строки.
+    """
+    def __init__(self, message: str, line_number: int, line: str):
+        """
+        Инициализирует объект ParseError.
+        :param message: Описание ошибки.
+        :param line_number: Номер строки в потоке (с единицы).
+        :param line: Исходный текст строки.
+        """
+        super().__init__(f'line {line_number}: {message}')
+        self.line_number = line_number
+        self.line = line
+
+
+_KINDS = (Rational, Complex)
+
+
+def iter_values(source: Iterable[str | bytes], kind: type = Complex, comment: str | None = '#') -> Iterator:
+    """
+    Лениво разбирает поток строк, по одному значению на строку.
+    Пустые строки и строки, начинающиеся с символа комментария, пропускаются.
+    :param source: Любой итерируемый источник строк: файл, socket.makefile(), список.
+    :param kind: Тип значений: Rational или Complex.
+    :param comment: Префикс строк-комментариев (None, чтобы отключить).
+    :return: Генератор значений указанного типа.
+    :raises ParseError: Если строка не является корректной записью числа.
+    """
+    if kind not in _KINDS:
+        raise TypeError(f'unsupported kind: {kind!r}')
+    build = kind.from_string
+    for line_number, line in enumerate(source, 1):
+        try:
+            if isinstance(line, bytes):
+                line = line.decode()
+            text = line.strip()
+            if not text or (comment and text.startswith(comment)):
+                continue
+            value = build(text)
+        except ValueError as e:
+            if isinstance(line, bytes):
+                line = line.decode(errors='replace')
+            raise ParseError(str(e), line_number, line.rstrip('\r\n')) from e
+        yield value
+
+
+def iter_batches(source: Iterable[str | bytes], kind: type = Complex, batch_size: int = 1024,
+                 comment: str | None = '#') -> Iterator[list]:
+    """
+    Разбирает поток строк пакетами фиксированного размера.
+    В памяти одновременно находится не более одного пакета, поэтому поток может быть сколь угодно большим.
+    :param source: Любой итерируемый источник строк.
+    :param kind: Тип значений: Rational или Complex.
+    :param batch_size: Максимальный размер пакета.
+    :param comment: Префикс строк-комментариев (None, чтобы отключить).
+    :return: Генератор списков значений; последний список может быть короче batch_size.
+    :raises ValueError: Если batch_size не положителен.
+    :raises ParseError: Если строка не является корректной записью числа.
+    """
+    if batch_size <= 0:
+        raise ValueError('batch_size must be positive')
+    batch = []
+    for value in iter_values(source, kind, comment):
+        batch.append(value)
+        if len(batch) == batch_size:
+            yield batch
+            batch = []
+    if batch:
+        yield batch
+
+
+def parse_file(path, kind: type = Complex, batch_size: int = 1024, encoding: str = 'utf-8') -> Iterator[list]:
+    """
+    Построчно читает файл и возвращает значения пакетами.
+    :param path: Путь к файлу.
+    :param kind: Тип значений: Rational или Complex.
+    :param batch_size: Максимальный размер пакета.
+    :param encoding: Кодировка файла.
+    :return: Генератор списков значений.
+    """
+    with open(path, encoding=encoding) as f:
+        yield from iter_batches(f, kind, batch_size)
@@ -1,29 +1,195 @@
 import math
+import numbers
+import re
+import sys
 from fractions import Fraction
 
+_RATIONAL_RE = re.compile(
+    r'\s*(?:Rational\(\s*(?P<rn>[+-]?\d+)\s*,\s*(?P<rd>[+-]?\d+)\s*\)'
+    r'|(?P<n>[+-]?\s*\d+)(?:\s*/\s*(?P<d>[+-]?\d+))?)\s*'
+)
+
+
+def _parse_rational(text: str) -> tuple[int, int]:
+    """
+    Разбирает строку вида "3/4", "-5" или "Rational(3, 4)" на числитель и знаменатель.
+    :param text: Строка для разбора.
+    :return: Кортеж (числитель, знаменатель) без упрощения.
+    :raises ValueError: Если строка не является записью рационального числа.
+    """
+    match = _RATIONAL_RE.fullmatch(text)
+    if match is None:
+        raise ValueError(f'invalid rational literal: {text!r}')
+    if match.group('rn') is not None:
+        return int(match.group('rn')), int(match.group('rd'))
+    numerator = int(match.group('n').replace(' ', ''))
+    denominator = match.group('d')
+    return numerator, int(denominator) if denominator is not None else 1
+
+
+DEFAULT_MAX_DENOMINATOR = 10**6
+
+
+def _limit_ratio(numerator: int, denominator: int, max_denominator: int) -> tuple[int, int]:
+    """
+    Находит ближайшую к numerator/denominator дробь со знаменателем не больше max_denominator
+    разложением в цепную дробь. Результат совпадает с Fraction.limit_denominator, но вычисляется
+    в целых числах без создания промежуточных Fraction.
+    :param numerator: Числитель несократимой дроби.
+    :param denominator: Положительный знаменатель несократимой дроби.
+    :param max_denominator: Наибольший допустимый знаменатель.
+    :return: Кортеж (числитель, знаменатель) несократимой дроби.
+    :raises ValueError: Если max_denominator меньше 1.
+    """
+    if max_denominator < 1:
+        raise ValueError('max_denominator should be at least 1')
+    if denominator <= max_denominator:
+        return numerator, denominator
+    p0, q0, p1, q1 = 0, 1, 1, 0
+    n, d = numerator, denominator
+    while True:
+        a = n // d
+        q2 = q0 + a * q1
+        if q2 > max_denominator:
+            break
+        p0, q0, p1, q1 = p1, q1, p0 + a * p1, q2
+        n, d = d, n - a * d
+    # Лучшая промежуточная дробь против последней подходящей дроби p1/q1
+    k = (max_denominator - q0) // q1
+    p2, q2 = p0 + k * p1, q0 + k * q1
+    if abs(p1 * denominator - numerator * q1) * q2 <= abs(p2 * denominator - numerator * q2) * q1:
+        return p1, q1
+    return p2, q2
+
+
+def _float_to_ratio(value: float, max_denominator: int | None = DEFAULT_MAX_DENOMINATOR) -> tuple[int, int]:
+    """
+    Приближает число с плавающей точкой дробью с ограниченным знаменателем.
+    :param value: Исходное число.
+    :param max_denominator: Наибольший допустимый знаменатель (по умолчанию 10**6);
+                            None — точное значение float без приближения.
+    :return: Кортеж (числитель, знаменатель).
+    :raises ValueError: Если значение равно NaN.
+    :raises OverflowError: Если значение бесконечно.
+    """
+    if max_denominator is None:
+        return value.as_integer_ratio()
+    return _limit_ratio(*value.as_integer_ratio(), max_denominator)
+
+
+def _to_ratio(value, max_denominator: int) -> tuple[int, int]:
+    """
+    Возвращает (числитель, знаменатель) для int, float (с приближением) и реализаций numbers.Rational.
+    :raises TypeError: Если тип значения не поддерживается.
+    """
+    if isinstance(value, float):
+        return _float_to_ratio(value, max_denominator)
+    if isinstance(value, numbers.Rational):
+        return int(value.numerator), int(value.denominator)
+    raise TypeError(f'unsupported operand type for Rational: {type(value).__name__}')
+
+
+def _coerce(other):
+    """
+    Приводит Fraction и другие реализации numbers.Rational к Rational; остальные значения не меняет.
+    """
+    if isinstance(other, numbers.Rational) and not isinstance(other, (int, Rational)):
+        return Rational._from_parts(int(other.numerator), int(other.denominator))
+    return other
+
+
 class Rational:
     """
     Класс Rational представляет рациональное число (дробь) в виде числителя и знаменателя.
     Поддерживает арифметические операции, упрощение дробей и доступ к числителю и знаменателю через свойства.
     """
-    def __init__(self, n: int | float, m: int | float = 1):
+    def __init__(self, n: int | float | Fraction, m: int | float | Fraction = 1, *,
+                 max_denominator: int = DEFAULT_MAX_DENOMINATOR):
         """
         Инициализирует объект Rational.
-        :param n: Числитель дроби.
-        :param m: Знаменатель дроби (по умолчанию 1).
+        :param n: Числитель дроби. Fraction и Rational переносятся точно, без limit_denominator.
+        :param m: Знаменатель дроби (по умолчанию 1); допускает те же типы, что и числитель.
+        :param max_denominator: Наибольший знаменатель при приближении float (по умолчанию 10**6).
         :raises ValueError: Если знаменатель равен нулю.
+        :raises TypeError: Если тип числителя или знаменателя не поддерживается.
         """
         if m == 0:
             raise ValueError('division by zero')
-        if isinstance(n, float):
-            frac = Fraction(n).limit_denominator()
-            self.__numerator = frac.numerator
-            self.__denominator = frac.denominator
-        else:
+        if isinstance(n, int) and isinstance(m, int):
             self.__numerator = n
             self.__denominator = m
+        else:
+            n_num, n_den = _to_ratio(n, max_denominator)
+            m_num, m_den = _to_ratio(m, max_denominator)
+            self.__numerator = n_num * m_den
+            self.__denominator = n_den * m_num
         self._simplify()
 
+    @classmethod
+    def from_string(cls, text: str):
+        """
+        Создаёт рациональное число из строкового представления.
+        Принимает формат __str__ ("3/4", "-5") и формат __repr__ ("Rational(3, 4)").
+        :param text: Строка для разбора.
+        :return: Новое рациональное число.
+        :raises ValueError: Если строка некорректна или знаменатель равен нулю.
+        """
+        return cls(*_parse_rational(text))
+
+    @classmethod
+    def from_fraction(cls, value: Fraction):
+        """
+        Создаёт рациональное число из fractions.Fraction без потери точности.
+        :param value: Исходная дробь.
+        :return: Новое рациональное число.
+        """
+        return cls(value.numerator, value.denominator)
+
+    @classmethod
+    def from_float(cls, value: float, max_denominator: int | None = None):
+        """
+        Создаёт рациональное число из float.
+        :param value: Исходное число.
+        :param max_denominator: Наибольший знаменатель; None (по умолчанию) — точное значение float.
+        :return: Новое рациональное число.
+        :raises ValueError: Если значение равно NaN.
+        :raises OverflowError: Если значение бесконечно.
+        """
+        return cls._from_parts(*_float_to_ratio(value, max_denominator))
+
+    def to_fraction(self) -> Fraction:
+        """
+        Преобразует рациональное число в fractions.Fraction без потери точности.
+        :return: Равная дробь Fraction.
+        """
+        return Fraction(self.__numerator, self.__denominator)
+
+    @classmethod
+    def _from_parts(cls, numerator: int, denominator: int):
+        """
+        Создаёт число из уже несократимой пары без проверки и вызова _simplify.
+        Используется при распаковке данных, сохранённых из готовых объектов Rational.
+        """
+        obj = cls.__new__(cls)
+        obj.__numerator = numerator
+        obj.__denominator = denominator
+        return obj
+
+    def __reduce__(self):
+        """
+        Компактное представление для pickle: два целых числа без повторного упрощения при загрузке.
+        """
+        return _rational_from_parts, (self.__numerator, self.__denominator)
+
+    def limit_denominator(self, max_denominator: int = DEFAULT_MAX_DENOMINATOR):
+        """
+        Возвращает ближайшее рациональное число со знаменателем не больше max_denominator.
+        :param max_denominator: Наибольший допустимый знаменатель.
+        :return: Новое рациональное число.
+        :raises ValueError: Если max_denominator меньше 1.
+        """
+        return Rational._from_parts(*_limit_ratio(self.__numerator, self.__denominator, max_denominator))
+
     def _simplify(self):
         """
         Упрощает дробь, приводя её к несократимому виду.
@@ -80,6 +246,7 @@ class Rational:
         :param other: Другое рациональное число или число типа int/float.
         :return: Результат сложения.
         """
+        other = _coerce(other)
         if isinstance(other, Rational):
             new_numerator = self.__numerator * other.__denominator + other.__numerator * self.__denominator
             new_denominator = self.__denominator * other.__denominator
@@ -94,6 +261,7 @@ class Rational:
         :param other: Другое рациональное число или число типа int/float.
         :return: Результат вычитания.
         """
+        other = _coerce(other)
         if isinstance(other, Rational):
             new_numerator = self.__numerator * other.__denominator - other.__numerator * self.__denominator
             new_denominator = self.__denominator * other.__denominator
@@ -108,6 +276,7 @@ class Rational:
         :param other: Другое рациональное число или число типа int/float.
         :return: Результат умножения.
         """
+        other = _coerce(other)
         if isinstance(other, Rational):
             new_numerator = self.__numerator * other.__numerator
             new_denominator = self.__denominator * other.__denominator
@@ -123,6 +292,7 @@ class Rational:
         :return: Результат деления.
         :raises ZeroDivisionError: Если делитель равен нулю.
         """
+        other = _coerce(other)
         if isinstance(other, Rational):
             if other.__numerator == 0:
                 raise ZeroDivisionError("Cannot divide by zero")
@@ -135,6 +305,171 @@ class Rational:
             return Rational(self.__numerator, self.__denominator * other)
         return NotImplemented
 
+    def __radd__(self, other):
+        """
+        Сложение числа с рациональным числом.
+        :param other: Число типа int/float или Fraction.
+        :return: Результат сложения, как у __add__.
+        """
+        return self.__add__(other)
+
+    def __rsub__(self, other):
+        """
+        Вычитание рационального числа из числа.
+        :param other: Уменьшаемое типа int/float или Fraction.
+        :return: Результат вычитания, как у __sub__.
+        """
+        other = _coerce(other)
+        if isinstance(other, (int, float, Rational)):
+            return -self + other
+        return NotImplemented
+
+    def __rmul__(self, other):
+        """
+        Умножение числа на рациональное число.
+        :param other: Число типа int/float или Fraction.
+        :return: Результат умножения, как у __mul__.
+        """
+        return self.__mul__(other)
+
+    def __rtruediv__(self, other):
+        """
+        Деление числа на рациональное число.
+        :param other: Делимое типа int/float или Fraction.
+        :return: Результат деления, как у __truediv__.
+        :raises ZeroDivisionError: Если текущее число равно нулю.
+        """
+        other = _coerce(other)
+        if isinstance(other, (int, float)):
+            other = Rational(other)
+        if isinstance(other, Rational):
+            return other / self
+        return NotImplemented
+
+    def __floordiv__(self, other):
+        """
+        Целочисленное деление с округлением вниз.
+        :param other: Делитель: Rational, int, Fraction или float.
+        :return: int для точных операндов, float для float.
+        :raises ZeroDivisionError: Если делитель равен нулю.
+        """
+        other = _coerce(other)
+        if isinstance(other, int):
+            other = Rational(other)
+        if isinstance(other, Rational):
+            return (self.__numerator * other.__denominator) // (self.__denominator * other.__numerator)
+        elif isinstance(other, float):
+            return float(self) // other
+        return NotImplemented
+
+    def __rfloordiv__(self, other):
+        """
+        Целочисленное деление числа на рациональное число с округлением вниз.
+        :param other: Делимое типа int/float или Fraction.
+        :return: int для точных операндов, float для float.
+        """
+        other = _coerce(other)
+        if isinstance(other, int):
+            other = Rational(other)
+        if isinstance(other, Rational):
+            return other // self
+        elif isinstance(other, float):
+            return other // float(self)
+        return NotImplemented
+
+    def __mod__(self, other):
+        """
+        Остаток от деления с округлением частного вниз (знак как у делителя).
+        :param other: Делитель: Rational, int, Fraction или float.
+        :return: Rational для точных операндов, float для float.
+        :raises ZeroDivisionError: Если делитель равен нулю.
+        """
+        other = _coerce(other)
+        if isinstance(other, int):
+            other = Rational(other)
+        if isinstance(other, Rational):
+            remainder = (self.__numerator * other.__denominator) % (other.__numerator * self.__denominator)
+            return Rational(remainder, self.__denominator * other.__denominator)
+        elif isinstance(other, float):
+            return float(self) % other
+        return NotImplemented
+
+    def __rmod__(self, other):
+        """
+        Остаток от деления числа на рациональное число.
+        :param other: Делимое типа int/float или Fraction.
+        :return: Rational для точных операндов, float для float.
+        """
+        other = _coerce(other)
+        if isinstance(other, int):
+            other = Rational(other)
+        if isinstance(other, Rational):
+            return other % self
+        elif isinstance(other, float):
+            return other % float(self)
+        return NotImplemented
+
+    def __divmod__(self, other):
+        """
+        Возвращает пару (self // other, self % other).
+        """
+        quotient = self.__floordiv__(other)
+        if quotient is NotImplemented:
+            return NotImplemented
+        return quotient, self % other
+
+    def __rdivmod__(self, other):
+        """
+        Возвращает пару (other // self, other % self).
+        """
+        quotient = self.__rfloordiv__(other)
+        if quotient is NotImplemented:
+            return NotImplemented
+        return quotient, self.__rmod__(other)
+
+    def __pow__(self, other):
+        """
+        Возведение рационального числа в степень.
+        :param other: Показатель степени. Целый показатель (int или Rational со знаменателем 1)
+                      даёт точный Rational, дробный — float.
+        :return: Результат возведения в степень.
+        :raises ZeroDivisionError: Если ноль возводится в отрицательную степень.
+        """
+        other = _coerce(other)
+        if isinstance(other, Rational) and other.__denominator == 1:
+            other = other.__numerator
+        if isinstance(other, int):
+            if other >= 0:
+                return Rational._from_parts(self.__numerator ** other, self.__denominator ** other)
+            if self.__numerator == 0:
+                raise ZeroDivisionError("Cannot divide by zero")
+            return Rational(self.__denominator ** -other, self.__numerator ** -other)
+        elif isinstance(other, (float, Rational)):
+            return float(self) ** float(other)
+        return NotImplemented
+
+    def __rpow__(self, other):
+        """
+        Возведение числа в рациональную степень.
+        :param other: Основание типа int/float или Fraction.
+        :return: Точный результат для целого показателя и точного основания, иначе float.
+        """
+        other = _coerce(other)
+        if isinstance(other, int):
+            other = Rational(other)
+        if isinstance(other, Rational):
+            return other ** self
+        elif isinstance(other, float):
+            return other ** float(self)
+        return NotImplemented
+
+    def __pos__(self):
+        """
+        Возвращает копию рационального числа.
+        :return: Новое рациональное число с теми же числителем и знаменателем.
+        """
+        return Rational._from_parts(self.__numerator, self.__denominator)
+
     def __neg__(self):
         """
         Возвращает противоположное рациональное число.
@@ -148,12 +483,90 @@ class Rational:
         :param other: Другое рациональное число или число типа int/float.
         :return: True, если числа равны, иначе False. При несовместимых типах возвращает NotImplemented.
         """
+        other = _coerce(other)
         if isinstance(other, Rational):
             return self.__numerator == other.__numerator and self.__denominator == other.__denominator
         elif isinstance(other, (int, float)):
             return float(self) == other
         return NotImplemented
 
+    def __hash__(self):
+        """
+        Вычисляет хеш по тому же правилу, что и Fraction: равные числа (int, float, Fraction)
+        имеют равный хеш.
+        :return: Хеш числа.
+        """
+        try:
+            inverse = pow(self.__denominator, -1, sys.hash_info.modulus)
+        except ValueError:
+            # Знаменатель кратен модулю: по соглашению хеш равен хешу бесконечности
+            result = sys.hash_info.inf
+        else:
+            result = hash(hash(abs(self.__numerator)) * inverse)
+        if self.__numerator < 0:
+            result = -result
+        return -2 if result == -1 else result
+
+    def __lt__(self, other):
+        """
+        Проверяет, что текущее число меньше другого. Сравнение Rational и int точное.
+        :param other: Другое рациональное число или число типа int/float.
+        :return: True, если текущее число меньше. При несовместимых типах возвращает NotImplemented.
+        """
+        other = _coerce(other)
+        if isinstance(other, Rational):
+            return self.__numerator * other.__denominator < other.__numerator * self.__denominator
+        elif isinstance(other, int):
+            return self.__numerator < other * self.__denominator
+        elif isinstance(other, float):
+            return float(self) < other
+        return NotImplemented
+
+    def __le__(self, other):
+        """
+        Проверяет, что текущее число меньше другого или равно ему.
+        :param other: Другое рациональное число или число типа int/float.
+        :return: True, если текущее число не больше. При несовместимых типах возвращает NotImplemented.
+        """
+        other = _coerce(other)
+        if isinstance(other, Rational):
+            return self.__numerator * other.__denominator <= other.__numerator * self.__denominator
+        elif isinstance(other, int):
+            return self.__numerator <= other * self.__denominator
+        elif isinstance(other, float):
+            return float(self) <= other
+        return NotImplemented
+
+    def __gt__(self, other):
+        """
+        Проверяет, что текущее число больше другого.
+        :param other: Другое рациональное число или число типа int/float.
+        :return: True, если текущее число больше. При несовместимых типах возвращает NotImplemented.
+        """
+        other = _coerce(other)
+        if isinstance(other, Rational):
+            return self.__numerator * other.__denominator > other.__numerator * self.__denominator
+        elif isinstance(other, int):
+            return self.__numerator > other * self.__denominator
+        elif isinstance(other, float):
+            return float(self) > other
+        return NotImplemented
+
+    def __ge__(self, other):
+        """
+        Проверяет, что текущее число больше другого или равно ему.
+        :param other: Другое рациональное число или число типа int/float.
+        :return: True, если текущее число не меньше. При несовместимых типах возвращает NotImplemented.
+        """
+        other = _coerce(other)
+        if isinstance(other, Rational):
+            return self.__numerator * other.__denominator >= other.__numerator * self.__denominator
+        elif isinstance(other, int):
+            return self.__numerator >= other * self.__denominator
+        elif isinstance(other, float):
+            return float(self) >= other
+        return NotImplemented
+
     def __float__(self):
         """
         Преобразует рациональное число в число с плавающей точкой.
@@ -161,6 +574,90 @@ class Rational:
         """
         return self.__numerator / self.__denominator
 
+    def __int__(self):
+        """
+        Преобразует рациональное число в целое с отбрасыванием дробной части (как int(Fraction)).
+        :return: Целая часть числа.
+        """
+        if self.__numerator < 0:
+            return -(-self.__numerator // self.__denominator)
+        return self.__numerator // self.__denominator
+
+    def __trunc__(self):
+        """
+        Отбрасывает дробную часть (округление к нулю).
+        :return: int.
+        """
+        return self.__int__()
+
+    def __floor__(self):
+        """
+        Округляет вниз.
+        :return: int.
+        """
+        return self.__numerator // self.__denominator
+
+    def __ceil__(self):
+        """
+        Округляет вверх.
+        :return: int.
+        """
+        return -(-self.__numerator // self.__denominator)
+
+    def __round__(self, ndigits: int | None = None):
+        """
+        Округляет к ближайшему, половины — к чётному (как round(Fraction)).
+        :param ndigits: Число знаков после запятой; None — округление до int.
+        :return: int, если ndigits равен None, иначе Rational.
+        """
+        if ndigits is None:
+            floor, remainder = divmod(self.__numerator, self.__denominator)
+            if remainder * 2 < self.__denominator:
+                return floor
+            elif remainder * 2 > self.__denominator:
+                return floor + 1
+            return floor if floor % 2 == 0 else floor + 1
+        shift = 10 ** abs(ndigits)
+        if ndigits > 0:
+            return Rational(round(self * shift), shift)
+        return Rational(round(self / shift) * shift)
+
+    @property
+    def real(self):
+        """
+        Действительная часть (само число) для совместимости с numbers.Real.
+        """
+        return self
+
+    @property
+    def imag(self):
+        """
+        Мнимая часть (всегда 0) для совместимости с numbers.Real.
+        """
+        return 0
+
+    def conjugate(self):
+        """
+        Комплексно-сопряжённое число (копия самого числа).
+        """
+        return +self
+
+    def __complex__(self):
+        """
+        Преобразует рациональное число во встроенный complex.
+        """
+        return complex(float(self))
+
+    def __index__(self):
+        """
+        Позволяет использовать целое рациональное число как индекс.
+        :return: Значение числа как int.
+        :raises TypeError: Если знаменатель не равен 1.
+        """
+        if self.__denominator != 1:
+            raise TypeError(f'{self} is not an integer')
+        return self.__numerator
+
     def __abs__(self):
         """
         Возвращает модуль (абсолютное значение) рационального числа.
@@ -185,3 +682,12 @@ class Rational:
         """
         return f"Rational({self.__numerator}, {self.__denominator})"
 
+
+def _rational_from_parts(numerator: int, denominator: int) -> Rational:
+    """
+    Восстанавливает Rational при распаковке pickle.
+    """
+    return Rational._from_parts(numerator, denominator)
+
+
+numbers.Rational.register(Rational)
@@ -0,0 +1,447 @@
+"""
+Сервис пакетного вычисления выражений над Complex по протоколу JSON-lines (TCP или Unix-сокет).
+
+Запрос:  {"id": 1, "op": "mul", "args": ["1/2 - 3/4i", "2 + i"]}
+Ответ:   {"id": 1, "result": "7/4 - 1i"}  или  {"id": 1, "error": "..."}
+
+Одновременные запросы всех клиентов собираются в пакеты (не больше max_batch за batch_delay
+секунд) и вычисляются одним проходом по каждой операции. Размер результата оценивается
+заранее по длинам операндов и показателю степени: слишком большие запросы сразу отклоняются,
+а тяжёлые пакеты отправляются в пул процессов. Очередь ограничена max_pending: при её заполнении сервер
+перестаёт читать сокеты, и клиенты упираются в обратное давление TCP.
+
+Запуск: python -m src.service_n --port 8765
+"""
+import argparse
+import asyncio
+import itertools
+import functools
+import json
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from src.complex_n import Complex
+
+
+class ServiceError(Exception):
+    """
+    Ошибка, возвращённая сервером в ответ на запрос.
+    """
+
+
+MAX_EXPONENT = 4096
+# str() для int ограничен sys.get_int_max_str_digits() (по умолчанию 4300 цифр, около 14 280 бит)
+MAX_RESULT_BITS = 14_000
+
+_OPERATIONS = {
+    'add': (2, lambda a, b: a + b),
+    'sub': (2, lambda a, b: a - b),
+    'mul': (2, lambda a, b: a * b),
+    'truediv': (2, lambda a, b: a / b),
+    'pow': (2, lambda a, n: a ** n),
+    'neg': (1, lambda a: -a),
+    'conjugate': (1, lambda a: a.conjugate()),
+    'norm2': (1, lambda a: a.norm2()),
+    'abs': (1, lambda a: abs(a)),
+}
+
+
+def _bits(value: Complex) -> int:
+    """
+    Возвращает наибольшую длину в битах среди числителей и знаменателей частей числа.
+    """
+    return max(value.real.numerator.bit_length(), value.real.denominator.bit_length(),
+               value.imagine.numerator.bit_length(), value.imagine.denominator.bit_length(), 1)
+
+
+# Оценка сверху длины частей результата в битах по длинам операндов
+_RESULT_BITS = {
+    'add': lambda a, b: a + b + 1,
+    'sub': lambda a, b: a + b + 1,
+    'mul': lambda a, b: 2 * (a + b) + 1,
+    'truediv': lambda a, b: a + b,
+    'pow': lambda a, n: 2 * a * max(n, 1),
+    'neg': lambda a: a,
+    'conjugate': lambda a: a,
+    'norm2': lambda a: 4 * a + 1,
+    'abs': lambda a: a,
+}
+
+
+def prepare_job(op: str, args: list[str], max_exponent: int = MAX_EXPONENT,
+                max_result_bits: int = MAX_RESULT_BITS) -> tuple[list, int]:
+    """
+    Разбирает и проверяет задание до вычисления.
+    :param op: Операция.
+    :param args: Аргументы в текстовом формате Complex (для pow второй аргумент — целый показатель).
+    :param max_exponent: Наибольший допустимый показатель степени.
+    :param max_result_bits: Наибольшая допустимая оценка длины частей результата в битах.
+    :return: Кортеж (операнды, оценка длины результата в битах); оценка служит и мерой стоимости.
+    :raises ValueError: Если операция неизвестна, аргументы некорректны или результат слишком велик.
+    """
+    if op not in _OPERATIONS:
+        raise ValueError(f'unknown operation: {op!r}')
+    arity, _ = _OPERATIONS[op]
+    if len(args) != arity:
+        raise ValueError(f'{op} expects {arity} argument(s), got {len(args)}')
+    if op == 'pow':
+        exponent = int(args[1])
+        if not 0 <= exponent <= max_exponent:
+            raise ValueError(f'exponent must be between 0 and {max_exponent}')
+        operands = [Complex.from_string(args[0]), exponent]
+        bits = _RESULT_BITS[op](_bits(operands[0]), exponent)
+    else:
+        operands = [Complex.from_string(a) for a in args]
+        bits = _RESULT_BITS[op](*[_bits(a) for a in operands])
+    if bits > max_result_bits:
+        raise ValueError(f'result too large: about {bits} bits per part (limit {max_result_bits})')
+    return operands, bits
+
+
+def evaluate_batch(jobs: list[tuple[str, list]]) -> list[tuple[bool, str]]:
+    """
+    Вычисляет пакет заданий, подготовленных prepare_job, группируя их по операции.
+    Функция не зависит от состояния сервера, поэтому может выполняться в другом процессе
+    (операнды Complex сериализуются компактно).
+    :param jobs: Список пар (операция, операнды из prepare_job).
+    :return: Список пар (успех, результат или текст ошибки) в порядке заданий.
+    """
+    groups = {}
+    for position, (op, _) in enumerate(jobs):
+        groups.setdefault(op, []).append(position)
+    results = [None] * len(jobs)
+    for op, positions in groups.items():
+        func = _OPERATIONS[op][1]
+        for position in positions:
+            try:
+                results[position] = (True, str(func(*jobs[position][1])))
+            except (ValueError, TypeError, ZeroDivisionError, OverflowError) as e:
+                results[position] = (False, str(e) or type(e).__name__)
+    return results
+
+
+class _Connection:
+    """
+    Состояние одного соединения: поток записи и число запросов, ожидающих ответа.
+    """
+    __slots__ = ('writer', 'pending', 'idle')
+
+    def __init__(self, writer: asyncio.StreamWriter):
+        self.writer = writer
+        self.pending = 0
+        self.idle = asyncio.Event()
+        self.idle.set()
+
+    def add(self):
+        self.pending += 1
+        self.idle.clear()
+
+    def done(self):
+        self.pending -= 1
+        if not self.pending:
+            self.idle.set()
+
+
+class BatchServer:
+    """
+    Асинхронный сервер пакетного вычисления.
+    """
+    def __init__(self, max_batch: int = 256, batch_delay: float = 0.002, max_pending: int = 1024,
+                 workers: int = 0, offload_threshold: int = 20_000, line_limit: int = 2**20,
+                 max_exponent: int = MAX_EXPONENT, max_result_bits: int = MAX_RESULT_BITS):
+        """
+        Инициализирует объект BatchServer.
+        :param max_batch: Максимальный размер пакета.
+        :param batch_delay: Время ожидания дополнительных запросов для пакета, в секундах.
+        :param max_pending: Максимальное число запросов в очереди (обратное давление).
+        :param workers: Число процессов для тяжёлых пакетов (0 — вычислять в цикле событий).
+        :param offload_threshold: Суммарная оценка длины результатов пакета в битах (по длинам
+                                  операндов и показателю степени), начиная с которой пакет
+                                  уходит в пул процессов.
+        :param line_limit: Максимальная длина строки запроса в байтах.
+        :param max_exponent: Наибольший допустимый показатель степени.
+        :param max_result_bits: Наибольшая допустимая оценка длины частей результата в битах;
+                                запросы сверх неё отклоняются до вычисления.
+        """
+        if max_batch <= 0 or max_pending <= 0:
+            raise ValueError('max_batch and max_pending must be positive')
+        self.max_batch = max_batch
+        self.batch_delay = batch_delay
+        self.max_pending = max_pending
+        self.workers = workers
+        self.offload_threshold = offload_threshold
+        self.line_limit = line_limit
+        self.max_exponent = max_exponent
+        self.max_result_bits = max_result_bits
+        self.batches = 0
+        self.offloaded = 0
+        self._queue = None
+        self._server = None
+        self._batcher = None
+        self._executor = None
+        self._connections = set()
+
+    async def start(self, host: str = '127.0.0.1', port: int = 0, path: str | None = None):
+        """
+        Запускает сервер на TCP-адресе или, если задан path, на Unix-сокете.
+        :param host: Адрес для TCP.
+        :param port: Порт для TCP (0 — выбрать свободный).
+        :param path: Путь к Unix-сокету.
+        """
+        self._queue = asyncio.Queue(self.max_pending)
+        if self.workers > 0:
+            self._executor = ProcessPoolExecutor(self.workers)
+        if path is not None:
+            self._server = await asyncio.start_unix_server(self._handle, path, limit=self.line_limit)
+        else:
+            self._server = await asyncio.start_server(self._handle, host, port, limit=self.line_limit)
+        self._batcher = asyncio.create_task(self._run_batches())
+
+    @property
+    def address(self):
+        """
+        :return: Адрес первого слушающего сокета: (host, port) или путь к Unix-сокету.
+        """
+        return self._server.sockets[0].getsockname()
+
+    async def close(self):
+        """
+        Останавливает сервер, закрывает соединения и пул процессов.
+        """
+        if self._server is not None:
+            self._server.close()
+            for connection in list(self._connections):
+                connection.writer.close()
+                # Ответы закрытому соединению не нужны: обработчик может завершиться
+                connection.idle.set()
+            await self._server.wait_closed()
+            self._server = None
+        if self._batcher is not None:
+            self._batcher.cancel()
+            try:
+                await self._batcher
+            except asyncio.CancelledError:
+                pass
+            self._batcher = None
+        if self._executor is not None:
+            self._executor.shutdown()
+            self._executor = None
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        await self.close()
+
+    async def _handle(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        """
+        Читает запросы одного соединения и ставит их в общую очередь.
+        После конца потока ждёт ответов на все запросы соединения и закрывает его.
+        """
+        connection = _Connection(writer)
+        self._connections.add(connection)
+        try:
+            while True:
+                try:
+                    line = await reader.readline()
+                except (ValueError, ConnectionError):
+                    break
+                if not line:
+                    break
+                if not line.strip():
+                    continue
+                try:
+                    request = json.loads(line)
+                    op, args = request['op'], [str(a) for a in request['args']]
+                    request_id = request.get('id')
+                except (ValueError, KeyError, TypeError, AttributeError) as e:
+                    self._send(writer, {'id': None, 'error': f'bad request: {e}'})
+                    continue
+                try:
+                    # Единственный разбор запроса: в пакет попадают готовые операнды
+                    operands, cost = prepare_job(op, args, self.max_exponent, self.max_result_bits)
+                except (ValueError, TypeError) as e:
+                    self._send(writer, {'id': request_id, 'error': str(e)})
+                else:
+                    connection.add()
+                    await self._queue.put((request_id, (op, operands), cost, connection))
+                # Ответы пишет общий цикл пакетов; ожидание отправки здесь тормозит только
+                # этого клиента, если он не читает ответы.
+                try:
+                    await writer.drain()
+                except ConnectionError:
+                    break
+            await connection.idle.wait()
+        finally:
+            self._connections.discard(connection)
+            writer.close()
+            try:
+                await writer.wait_closed()
+            except ConnectionError:
+                pass
+
+    @staticmethod
+    def _send(writer: asyncio.StreamWriter, message: dict):
+        if not writer.is_closing():
+            writer.write(json.dumps(message).encode() + b'\n')
+
+    async def _collect(self) -> list:
+        """
+        Ждёт первый запрос и добирает пакет в течение batch_delay.
+        """
+        loop = asyncio.get_running_loop()
+        batch = [await self._queue.get()]
+        deadline = loop.time() + self.batch_delay
+        while len(batch) < self.max_batch:
+            try:
+                batch.append(self._queue.get_nowait())
+                continue
+            except asyncio.QueueEmpty:
+                pass
+            remaining = deadline - loop.time()
+            if remaining <= 0:
+                break
+            try:
+                batch.append(await asyncio.wait_for(self._queue.get(), remaining))
+            except asyncio.TimeoutError:
+                break
+        return batch
+
+    async def _evaluate(self, jobs: list, cost: int) -> list[tuple[bool, str]]:
+        """
+        Вычисляет пакет в цикле событий или, если он тяжёлый, в пуле процессов.
+        """
+        evaluate = functools.partial(evaluate_batch, jobs)
+        if self._executor is not None and cost >= self.offload_threshold:
+            self.offloaded += 1
+            try:
+                return await asyncio.get_running_loop().run_in_executor(self._executor, evaluate)
+            except BrokenProcessPool:
+                # Процесс пула погиб: создаём новый пул для следующих пакетов
+                self._executor.shutdown(wait=False)
+                self._executor = ProcessPoolExecutor(self.workers)
+                raise
+        return evaluate()
+
+    async def _run_batches(self):
+        while True:
+            batch = await self._collect()
+            jobs = [job for _, job, _, _ in batch]
+            try:
+                results = await self._evaluate(jobs, sum(cost for _, _, cost, _ in batch))
+            except Exception as e:
+                results = [(False, f'internal error: {type(e).__name__}: {e}')] * len(batch)
+            self.batches += 1
+            for (request_id, _, _, connection), (ok, value) in zip(batch, results):
+                key = 'result' if ok else 'error'
+                self._send(connection.writer, {'id': request_id, key: value})
+                connection.done()
+
+
+class BatchClient:
+    """
+    Асинхронный клиент сервиса. Допускает много одновременных запросов по одному соединению.
+    """
+    def __init__(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        """
+        Инициализирует объект BatchClient. Обычно создаётся через connect().
+        """
+        self._reader = reader
+        self._writer = writer
+        self._ids = itertools.count()
+        self._pending = {}
+        self._listener = asyncio.create_task(self._listen())
+
+    @classmethod
+    async def connect(cls, host: str = '127.0.0.1', port: int = 0, path: str | None = None,
+                      line_limit: int = 2**20):
+        """
+        Подключается к серверу по TCP или, если задан path, через Unix-сокет.
+        :return: Новый клиент.
+        """
+        if path is not None:
+            reader, writer = await asyncio.open_unix_connection(path, limit=line_limit)
+        else:
+            reader, writer = await asyncio.open_connection(host, port, limit=line_limit)
+        return cls(reader, writer)
+
+    async def _listen(self):
+        try:
+            while line := await self._reader.readline():
+                message = json.loads(line)
+                future = self._pending.pop(message.get('id'), None)
+                if future is None or future.done():
+                    continue
+                if 'error' in message:
+                    future.set_exception(ServiceError(message['error']))
+                else:
+                    future.set_result(message['result'])
+        finally:
+            for future in self._pending.values():
+                if not future.done():
+                    future.set_exception(ConnectionError('connection closed'))
+            self._pending.clear()
+
+    async def evaluate(self, op: str, *args) -> str:
+        """
+        Отправляет запрос и ждёт результат.
+        :param op: Операция: add, sub, mul, truediv, pow, neg, conjugate, norm2, abs.
+        :param args: Аргументы: Complex, Rational, числа или строки в текстовом формате Complex.
+        :return: Результат в текстовом формате.
+        :raises ServiceError: Если сервер вернул ошибку.
+        """
+        request_id = next(self._ids)
+        future = asyncio.get_running_loop().create_future()
+        self._pending[request_id] = future
+        message = {'id': request_id, 'op': op, 'args': [str(a) for a in args]}
+        self._writer.write(json.dumps(message).encode() + b'\n')
+        await self._writer.drain()
+        return await future
+
+    async def close(self):
+        """
+        Закрывает соединение.
+        """
+        self._writer.close()
+        try:
+            await self._writer.wait_closed()
+        except ConnectionError:
+            pass
+        self._listener.cancel()
+        try:
+            await self._listener
+        except asyncio.CancelledError:
+            pass
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        await self.close()
+
+
+async def _serve(args):
+    server = BatchServer(args.max_batch, args.batch_delay, args.max_pending, args.workers)
+    await server.start(args.host, args.port, args.unix)
+    print(f'listening on {server.address}', flush=True)
+    async with server:
+        await asyncio.Event().wait()
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Batch evaluation service for Complex expressions.')
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--port', type=int, default=8765)
+    parser.add_argument('--unix', help='listen on this Unix socket path instead of TCP')
+    parser.add_argument('--max-batch', type=int, default=256)
+    parser.add_argument('--batch-delay', type=float, default=0.002)
+    parser.add_argument('--max-pending', type=int, default=1024)
+    parser.add_argument('--workers', type=int, default=0)
+    args = parser.parse_args(argv)
+    try:
+        asyncio.run(_serve(args))
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == '__main__':
+    main()
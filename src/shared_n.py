@@ -0,0 +1,208 @@
+"""
+Передача пакетов Complex между процессами через multiprocessing.shared_memory.
+
+Формат сегмента: заголовок (сигнатура, число значений, ширина компоненты в байтах, pid создателя),
+затем для каждого значения четыре целых со знаком фиксированной ширины (little-endian):
+числитель и знаменатель действительной части, числитель и знаменатель мнимой части.
+Ширина выбирается по самому длинному числу (не меньше 8 байт), поэтому большие целые
+не переполняются. Если все числа помещаются в int64, данные можно читать без копирования
+через int64_view() (например, numpy.frombuffer(batch.int64_view(), dtype=numpy.int64)).
+
+Создатель сегмента владеет им и удаляет его при close(); подключившиеся процессы только
+отсоединяются. Незакрытые сегменты освобождаются при сборке мусора и при выходе из процесса.
+"""
+import os
+import struct
+import sys
+import weakref
+import multiprocessing
+from multiprocessing import resource_tracker, shared_memory
+from src.rational_n import Rational
+from src.complex_n import Complex
+
+_MAGIC = b'CPLXSHM1'
+_HEADER = struct.Struct('<8sQQQ')
+_INT64_WIDTH = 8
+
+
+def _width(values) -> int:
+    """
+    Возвращает ширину компоненты в байтах, достаточную для всех чисел (кратную 8).
+    """
+    bits = 0
+    for value in values:
+        for part in (value.real, value.imagine):
+            bits = max(bits, part.numerator.bit_length(), part.denominator.bit_length())
+    needed = bits // 8 + 1  # плюс знаковый бит
+    return max(_INT64_WIDTH, -(-needed // _INT64_WIDTH) * _INT64_WIDTH)
+
+
+def _open_existing(name: str) -> shared_memory.SharedMemory:
+    """
+    Подключается к существующему сегменту, не передавая его resource_tracker (Python 3.13+).
+    """
+    if sys.version_info >= (3, 13):
+        return shared_memory.SharedMemory(name, track=False)
+    return shared_memory.SharedMemory(name)
+
+
+def _independent_process(creator_pid: int) -> bool:
+    """
+    Проверяет, что текущий процесс не создатель сегмента и не запущен через multiprocessing.
+    Дочерние процессы multiprocessing используют общий с родителем resource_tracker,
+    и снятие регистрации в них удалило бы запись создателя.
+    """
+    return (os.name == 'posix' and creator_pid != os.getpid()
+            and multiprocessing.parent_process() is None)
+
+
+def _release(shm: shared_memory.SharedMemory, owner: bool):
+    """
+    Отсоединяет сегмент и, если процесс им владеет, удаляет его.
+    Имя удаляется, даже если отсоединить сегмент не удалось из-за неосвобождённого представления.
+    """
+    try:
+        shm.close()
+    finally:
+        if owner:
+            try:
+                shm.unlink()
+            except FileNotFoundError:
+                pass
+
+
+class SharedComplexBatch:
+    """
+    Неизменяемый пакет комплексных чисел в разделяемой памяти.
+    Создаётся через create() в процессе-производителе и открывается через attach(name) в потребителях.
+    """
+    def __init__(self, shm: shared_memory.SharedMemory, owner: bool):
+        """
+        Инициализирует объект SharedComplexBatch. Используйте create() или attach().
+        :raises ValueError: Если сегмент не содержит пакет Complex.
+        """
+        magic, count, width, pid = _HEADER.unpack_from(shm.buf)
+        if magic != _MAGIC:
+            shm.close()
+            raise ValueError(f'shared memory {shm.name!r} does not contain a Complex batch')
+        self._shm = shm
+        self._count = count
+        self._width = width
+        self.owner = owner
+        if not owner and sys.version_info < (3, 13) and _independent_process(pid):
+            # До 3.13 подключение регистрирует сегмент в resource_tracker потребителя,
+            # и тот удалил бы чужой сегмент при выходе потребителя.
+            resource_tracker.unregister(shm._name, 'shared_memory')
+        self._finalizer = weakref.finalize(self, _release, shm, owner)
+
+    @classmethod
+    def create(cls, values, name: str | None = None):
+        """
+        Копирует комплексные числа в новый сегмент разделяемой памяти.
+        :param values: Последовательность Complex.
+        :param name: Имя сегмента (по умолчанию генерируется).
+        :return: Пакет, владеющий сегментом.
+        """
+        values = list(values)
+        width = _width(values)
+        size = _HEADER.size + len(values) * 4 * width
+        shm = shared_memory.SharedMemory(name, create=True, size=size)
+        try:
+            buf = shm.buf
+            _HEADER.pack_into(buf, 0, _MAGIC, len(values), width, os.getpid())
+            offset = _HEADER.size
+            for value in values:
+                for part in (value.real.numerator, value.real.denominator,
+                             value.imagine.numerator, value.imagine.denominator):
+                    buf[offset:offset + width] = part.to_bytes(width, 'little', signed=True)
+                    offset += width
+            del buf
+        except BaseException:
+            _release(shm, True)
+            raise
+        return cls(shm, owner=True)
+
+    @classmethod
+    def attach(cls, name: str):
+        """
+        Подключается к сегменту, созданному другим процессом.
+        :param name: Имя сегмента.
+        :return: Пакет только для чтения, не владеющий сегментом.
+        """
+        return cls(_open_existing(name), owner=False)
+
+    @property
+    def name(self) -> str:
+        """
+        :return: Имя сегмента для передачи в attach().
+        """
+        return self._shm.name
+
+    @property
+    def closed(self) -> bool:
+        return not self._finalizer.alive
+
+    def __len__(self):
+        return self._count
+
+    def _part(self, offset: int) -> int:
+        return int.from_bytes(self._shm.buf[offset:offset + self._width], 'little', signed=True)
+
+    def __getitem__(self, index: int) -> Complex:
+        """
+        Читает одно значение напрямую из разделяемой памяти.
+        :raises IndexError: Если индекс вне диапазона.
+        """
+        if self.closed:
+            raise ValueError('batch is closed')
+        if index < 0:
+            index += self._count
+        if not 0 <= index < self._count:
+            raise IndexError('batch index out of range')
+        offset = _HEADER.size + index * 4 * self._width
+        width = self._width
+        return Complex(Rational._from_parts(self._part(offset), self._part(offset + width)),
+                       Rational._from_parts(self._part(offset + 2 * width), self._part(offset + 3 * width)))
+
+    def __iter__(self):
+        for index in range(self._count):
+            yield self[index]
+
+    def to_list(self) -> list[Complex]:
+        """
+        :return: Список всех значений пакета.
+        """
+        return list(self)
+
+    def int64_view(self) -> memoryview:
+        """
+        Возвращает представление данных без копирования: memoryview формата 'q' формы (len, 4).
+        Представление нужно освободить (release()) до close().
+        :raises OverflowError: Если какое-либо число не помещается в int64.
+        """
+        if self.closed:
+            raise ValueError('batch is closed')
+        if self._width != _INT64_WIDTH:
+            raise OverflowError('batch contains integers wider than int64')
+        if sys.byteorder != 'little':
+            raise ValueError('int64_view requires a little-endian platform')
+        data = self._shm.buf[_HEADER.size:_HEADER.size + self._count * 4 * _INT64_WIDTH]
+        return data.cast('q', (self._count, 4)) if self._count else data.cast('q')
+
+    def close(self):
+        """
+        Отсоединяет сегмент; владелец также удаляет его. Повторный вызов ничего не делает.
+        :raises BufferError: Если остались неосвобождённые представления int64_view();
+                             пакет при этом остаётся открытым.
+        """
+        if self.closed:
+            return
+        # Сначала отсоединяемся сами: при ошибке финализатор остаётся живым
+        self._shm.close()
+        self._finalizer()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
@@ -0,0 +1,233 @@
+"""
+Точное упорядочивание и пространственный индекс для наборов комплексных чисел.
+
+Все сравнения точные и выполняются над целыми числителями и знаменателями Rational:
+квадрат модуля вместо sqrt, а аргумент сравнивается по полуплоскости и знаку
+векторного произведения вместо atan2.
+"""
+import functools
+import heapq
+from src.rational_n import Rational
+from src.complex_n import Complex
+
+
+def _parts(point: Complex) -> tuple[int, int, int, int]:
+    """
+    Возвращает числители и знаменатели координат: (x_num, x_den, y_num, y_den).
+    """
+    real, imagine = point.real, point.imagine
+    return real.numerator, real.denominator, imagine.numerator, imagine.denominator
+
+
+def magnitude_key(point: Complex) -> Rational:
+    """
+    Точный ключ сортировки по модулю: квадрат модуля.
+    :param point: Комплексное число.
+    :return: Квадрат модуля как Rational.
+    """
+    return point.norm2()
+
+
+@functools.total_ordering
+class ArgKey:
+    """
+    Точный ключ сортировки по аргументу в диапазоне (-pi, pi], как у Complex.arg().
+    Точки делятся на группы: нижняя полуплоскость, положительная действительная полуось
+    (и ноль), верхняя полуплоскость, отрицательная действительная полуось. Внутри
+    полуплоскости порядок определяется знаком векторного произведения.
+    """
+    __slots__ = ('half', 'x', 'y')
+
+    def __init__(self, point: Complex):
+        """
+        Инициализирует объект ArgKey.
+        :param point: Комплексное число.
+        """
+        real, imagine = point.real, point.imagine
+        # Умножение на положительное real.denominator * imagine.denominator не меняет направление.
+        self.x = real.numerator * imagine.denominator
+        self.y = imagine.numerator * real.denominator
+        if self.y < 0:
+            self.half = 0
+        elif self.y == 0:
+            self.half = 1 if self.x >= 0 else 3
+        else:
+            self.half = 2
+
+    def __eq__(self, other):
+        if not isinstance(other, ArgKey):
+            return NotImplemented
+        if self.half != other.half:
+            return False
+        return self.half in (1, 3) or self.x * other.y == self.y * other.x
+
+    def __lt__(self, other):
+        if not isinstance(other, ArgKey):
+            return NotImplemented
+        if self.half != other.half:
+            return self.half < other.half
+        return self.half in (0, 2) and self.x * other.y - self.y * other.x > 0
+
+    def __repr__(self):
+        return f"ArgKey(half={self.half}, x={self.x}, y={self.y})"
+
+
+def sort_by_magnitude(points, keys=None) -> list[Complex]:
+    """
+    Сортирует точки по модулю (точно), при равенстве модулей сохраняется исходный порядок.
+    :param points: Последовательность комплексных чисел.
+    :param keys: Заранее вычисленные ключи magnitude_key (необязательно).
+    :return: Новый отсортированный список.
+    """
+    if keys is None:
+        keys = [magnitude_key(p) for p in points]
+    order = sorted(range(len(points)), key=keys.__getitem__)
+    return [points[i] for i in order]
+
+
+def sort_by_arg(points, keys=None) -> list[Complex]:
+    """
+    Сортирует точки по аргументу (точно), при равенстве аргументов сохраняется исходный порядок.
+    :param points: Последовательность комплексных чисел.
+    :param keys: Заранее вычисленные ключи ArgKey (необязательно).
+    :return: Новый отсортированный список.
+    """
+    if keys is None:
+        keys = [ArgKey(p) for p in points]
+    order = sorted(range(len(points)), key=keys.__getitem__)
+    return [points[i] for i in order]
+
+
+def _radius2(radius) -> Rational:
+    """
+    Возвращает квадрат радиуса как Rational; float переносится точно.
+    :raises ValueError: Если радиус отрицательный.
+    """
+    radius = Rational.from_float(radius) if isinstance(radius, float) else Rational(radius)
+    if radius < 0:
+        raise ValueError('radius must be non-negative')
+    return radius * radius
+
+
+class KDTree:
+    """
+    Двумерное k-d дерево над набором комплексных чисел с точными расстояниями.
+    Поддерживает поиск ближайшего соседа, k ближайших соседей и точек в круге.
+    Результаты возвращаются как индексы в исходной последовательности.
+    """
+    def __init__(self, points):
+        """
+        Строит дерево. Числители и знаменатели координат извлекаются один раз.
+        :param points: Последовательность комплексных чисел.
+        """
+        self.points = list(points)
+        self._parts = [_parts(p) for p in self.points]
+        # Точные сравнения Rational нужны только для двух начальных сортировок;
+        # дальше узлы упорядочиваются по целым рангам.
+        self._ranks = [self._axis_ranks(lambda p: p.real), self._axis_ranks(lambda p: p.imagine)]
+        # Узел: (индекс точки, ось, левое поддерево, правое поддерево)
+        self._root = self._build(list(range(len(self.points))), 0)
+
+    def _axis_ranks(self, coordinate) -> list[int]:
+        """
+        Возвращает место каждой точки в порядке возрастания координаты.
+        """
+        points = self.points
+        ranks = [0] * len(points)
+        for rank, index in enumerate(sorted(range(len(points)), key=lambda i: coordinate(points[i]))):
+            ranks[index] = rank
+        return ranks
+
+    def _build(self, indices, axis):
+        if not indices:
+            return None
+        indices.sort(key=self._ranks[axis].__getitem__)
+        mid = len(indices) // 2
+        return (indices[mid], axis,
+                self._build(indices[:mid], 1 - axis),
+                self._build(indices[mid + 1:], 1 - axis))
+
+    def __len__(self):
+        return len(self.points)
+
+    def _search(self, query, visit, bound):
+        """
+        Обходит дерево в порядке близости к query.
+        Разности координат считаются как пары целых (числитель, знаменатель) без сокращения;
+        сокращается только итоговый квадрат расстояния.
+        :param query: Координаты запроса в формате _parts().
+        :param visit: Вызывается с (квадрат расстояния как Rational, индекс) для каждой посещённой точки.
+        :param bound: Возвращает текущий квадрат радиуса отсечения (None — без отсечения).
+        """
+        stack = [self._root]
+        parts = self._parts
+        qxn, qxd, qyn, qyd = query
+        while stack:
+            node = stack.pop()
+            if node is None:
+                continue
+            index, axis, left, right = node
+            pxn, pxd, pyn, pyd = parts[index]
+            dxn, dxd = pxn * qxd - qxn * pxd, pxd * qxd
+            dyn, dyd = pyn * qyd - qyn * pyd, pyd * qyd
+            dx2, dy2 = dxd * dxd, dyd * dyd
+            visit(Rational(dxn * dxn * dy2 + dyn * dyn * dx2, dx2 * dy2), index)
+            # Разность по оси разбиения: точка минус запрос, знаменатель положителен
+            diff, diff_den2 = (dxn, dx2) if axis == 0 else (dyn, dy2)
+            near, far = (left, right) if diff > 0 else (right, left)
+            limit = bound()
+            if limit is None or diff * diff * limit.denominator <= limit.numerator * diff_den2:
+                stack.append(far)
+            stack.append(near)
+
+    def knn(self, point: Complex, k: int) -> list[tuple[int, Rational]]:
+        """
+        Находит k ближайших точек.
+        :param point: Точка запроса.
+        :param k: Число соседей.
+        :return: Список (индекс, квадрат расстояния) по возрастанию расстояния,
+                 при равных расстояниях — по возрастанию индекса.
+        :raises ValueError: Если k не положительно.
+        """
+        if k <= 0:
+            raise ValueError('k must be positive')
+        heap = []  # элементы (-квадрат расстояния, -индекс): на вершине худший кандидат
+
+        def visit(dist2, index):
+            item = (-dist2, -index)
+            if len(heap) < k:
+                heapq.heappush(heap, item)
+            elif item > heap[0]:
+                heapq.heapreplace(heap, item)
+
+        self._search(_parts(point), visit, lambda: -heap[0][0] if len(heap) == k else None)
+        found = sorted((-d, -i) for d, i in heap)
+        return [(i, d) for d, i in found]
+
+    def nearest(self, point: Complex) -> tuple[int, Rational]:
+        """
+        Находит ближайшую точку.
+        :param point: Точка запроса.
+        :return: Кортеж (индекс, квадрат расстояния).
+        :raises ValueError: Если дерево пустое.
+        """
+        if not self.points:
+            raise ValueError('tree is empty')
+        return self.knn(point, 1)[0]
+
+    def within_radius(self, point: Complex, radius) -> list[int]:
+        """
+        Находит все точки на расстоянии не больше radius (включая границу).
+        :param point: Центр круга.
+        :param radius: Радиус (Rational, int, float или Fraction).
+        :return: Отсортированный список индексов.
+        """
+        limit = _radius2(radius)
+        found = []
+
+        def visit(dist2, index):
+            if dist2 <= limit:
+                found.append(index)
+
+        self._search(_parts(point), visit, lambda: limit)
+        return sorted(found)
@@ -0,0 +1,52 @@
+import json
+import os
+import tempfile
+import unittest
+from benchmarks.bench_n import run, compare, main, missing_cases
+
+
+class TestBench(unittest.TestCase):
+    def test_run_subset(self):
+        result = run('rational.add.small', min_time=0.001, repeat=1)
+        stats = result['results']['rational.add.small']
+        self.assertGreater(stats['ns_per_op'], 0)
+        self.assertGreaterEqual(stats['peak_bytes'], 0)
+        self.assertIn('retained_blocks', stats)
+        self.assertEqual(set(result['results']), {'rational.add.small'})
+
+    def test_compare(self):
+        baseline = {'results': {'a': {'ns_per_op': 100.0}, 'b': {'ns_per_op': 100.0}}}
+        current = {'results': {'a': {'ns_per_op': 105.0}, 'b': {'ns_per_op': 150.0}, 'c': {'ns_per_op': 1.0}}}
+        self.assertEqual(compare(current, baseline, 0.1), [('b', 100.0, 150.0)])
+        self.assertEqual(compare(current, baseline, 0.6), [])
+
+    def test_missing_cases(self):
+        baseline = {'results': {'a.x': {'ns_per_op': 1.0}, 'b.x': {'ns_per_op': 1.0}, 'c.y': {}}}
+        current = {'results': {'a.x': {'ns_per_op': 1.0}}}
+        self.assertEqual(missing_cases(current, baseline), ['b.x', 'c.y'])
+        self.assertEqual(missing_cases(current, baseline, '.x'), ['b.x'])
+
+    def test_main_missing_fails(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, 'bench.json')
+            with open(path, 'w') as f:
+                json.dump({'results': {'complex.neg.renamed': {'ns_per_op': 1.0}}}, f)
+            args = ['-k', 'complex.neg', '--min-time', '0.001', '--repeat', '1', '-b', path]
+            self.assertEqual(main(args), 1)
+
+    def test_main_baseline(self):
+        # Сохранение результатов и сравнение с базовым файлом
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, 'bench.json')
+            args = ['-k', 'complex.neg.small', '--min-time', '0.001', '--repeat', '1']
+            self.assertEqual(main(args + ['-o', path]), 0)
+            with open(path) as f:
+                data = json.load(f)
+            data['results']['complex.neg.small']['ns_per_op'] = 1e-6
+            with open(path, 'w') as f:
+                json.dump(data, f)
+            self.assertEqual(main(args + ['-b', path]), 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -200,6 +200,12 @@ class TestComplex(unittest.TestCase):
         self.assertEqual(result.real, Rational(-10**18))
         self.assertEqual(result.imagine, Rational(-10**18))
 
+    def test_pow_keeps_operand(self):
+        # Возведение в степень не должно изменять исходное число
+        a = Complex(1, 1)
+        self.assertEqual(a ** 2, Complex(0, 2))
+        self.assertEqual(a, Complex(1, 1))
+
     def test_large_arg(self):
         # Проверка аргумента комплексного числа с очень большими частями
         a = Complex(10**18, 10**18)
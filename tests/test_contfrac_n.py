@@ -0,0 +1,78 @@
+import math
+import random
+import unittest
+from fractions import Fraction
+from src.complex_n import Complex
+from src.rational_n import Rational
+from src.contfrac_n import (approximate_complex, best_approximation, best_approximations,
+                            convergents, partial_quotients)
+
+
+class TestContinuedFractions(unittest.TestCase):
+    def test_partial_quotients(self):
+        self.assertEqual(list(partial_quotients(Rational(415, 93))), [4, 2, 6, 7])
+        self.assertEqual(list(partial_quotients(Fraction(-7, 2))), [-4, 2])
+
+    def test_convergents(self):
+        result = list(convergents(Rational(415, 93)))
+        self.assertEqual(result, [Rational(4), Rational(9, 2), Rational(58, 13), Rational(415, 93)])
+        pi = convergents(math.pi)
+        self.assertEqual([next(pi) for _ in range(4)],
+                         [Rational(3), Rational(22, 7), Rational(333, 106), Rational(355, 113)])
+
+    def test_matches_limit_denominator(self):
+        # Результат совпадает с Fraction.limit_denominator
+        rng = random.Random(3)
+        for _ in range(500):
+            x = rng.uniform(-1000, 1000)
+            bound = rng.choice([1, 10, 1000, 10**6])
+            expected = Fraction(x).limit_denominator(bound)
+            result = best_approximation(x, bound)
+            self.assertEqual((result.numerator, result.denominator), (expected.numerator, expected.denominator))
+
+    def test_tolerance(self):
+        self.assertEqual(best_approximation(math.pi, tolerance=1e-2), Rational(22, 7))
+        self.assertEqual(best_approximation(math.pi, tolerance=Fraction(1, 10**6)), Rational(355, 113))
+        self.assertEqual(best_approximation(math.pi, max_denominator=10, tolerance=1e-9), Rational(22, 7))
+        with self.assertRaises(ValueError):
+            best_approximation(1.5, tolerance=-1)
+
+    def test_tolerance_semiconvergent(self):
+        # Промежуточная дробь 23/22 лучше подходящей 28/27
+        value = Fraction(690107, 665524)
+        self.assertEqual(best_approximation(value, tolerance=Fraction(1, 114)), Rational(23, 22))
+
+    def test_tolerance_brute_force(self):
+        # Знаменатель совпадает с наименьшим знаменателем, найденным перебором
+        rng = random.Random(5)
+        for _ in range(300):
+            value = Fraction(rng.randint(-5000, 5000), rng.randint(1, 5000))
+            tolerance = Fraction(1, rng.randint(1, 2000))
+            result = best_approximation(value, 10**6, tolerance)
+            self.assertLessEqual(abs(value - result.to_fraction()), tolerance)
+            q = 1
+            while abs(value - Fraction(round(value * q), q)) > tolerance:
+                q += 1
+            self.assertEqual(result.denominator, q)
+
+    def test_batch(self):
+        values = [0.1, 0.1, 1 / 3, 2, Rational(7, 3)]
+        self.assertEqual(best_approximations(values, 100),
+                         [Rational(1, 10), Rational(1, 10), Rational(1, 3), Rational(2), Rational(7, 3)])
+        with self.assertRaises(ValueError):
+            best_approximations([0.5], 0)
+
+    def test_rational_integration(self):
+        self.assertEqual(Rational(math.pi, max_denominator=100), Rational(311, 99))
+        self.assertEqual(Rational(0.1), Rational(1, 10))
+        self.assertEqual(Rational(355, 113).limit_denominator(10), Rational(22, 7))
+        with self.assertRaises(TypeError):
+            list(convergents("1/2"))
+
+    def test_complex(self):
+        value = Complex(Rational(355, 113), Rational(-314159, 100000))
+        self.assertEqual(approximate_complex(value, 10), Complex(Rational(22, 7), Rational(-22, 7)))
+
+
+if __name__ == '__main__':
+    unittest.main()
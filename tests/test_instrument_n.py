@@ -0,0 +1,96 @@
+import unittest
+from src import instrument_n
+from src.complex_n import Complex
+from src.contfrac_n import best_approximations
+from src.rational_n import Rational
+
+
+class TestInstrument(unittest.TestCase):
+    def tearDown(self):
+        while instrument_n.is_enabled():
+            instrument_n.disable()
+        instrument_n.reset()
+
+    def test_disabled_leaves_classes(self):
+        # Без включения методы классов не подменяются
+        original = Rational.__dict__['__add__']
+        self.assertFalse(instrument_n.is_enabled())
+        Rational(1, 2) + Rational(1, 3)
+        self.assertEqual(instrument_n.snapshot()['counts'], {})
+        with instrument_n.profile():
+            self.assertIsNot(Rational.__dict__['__add__'], original)
+        self.assertIs(Rational.__dict__['__add__'], original)
+
+    def test_counts(self):
+        with instrument_n.profile() as p:
+            Complex(1, 2) * Complex(3, 4)
+            Rational(1, 2) + 1
+        counts = p.snapshot['counts']
+        self.assertEqual(counts['Complex.__mul__'], 1)
+        self.assertEqual(counts['Rational.__mul__'], 4)
+        self.assertEqual(counts['Rational.__add__'], 2)
+        self.assertGreaterEqual(p.snapshot['simplify_calls'], counts['Rational.__init__'])
+
+    def test_float_and_bits(self):
+        with instrument_n.profile() as p:
+            Rational(0.5)
+            Rational(2**100 + 1, 3)
+        snap = p.snapshot
+        self.assertEqual(snap['float_calls'], 1)
+        self.assertGreaterEqual(snap['float_ns'], 0)
+        self.assertEqual(snap['numerator_bits'], {1: 1, 128: 1})
+        self.assertEqual(snap['denominator_bits'], {2: 2})
+
+    def test_contfrac_floats_timed(self):
+        with instrument_n.profile() as p:
+            best_approximations([0.1] * 3)
+        self.assertEqual(p.snapshot['float_calls'], 1)
+
+    def test_nested_enable(self):
+        instrument_n.enable()
+        instrument_n.enable()
+        instrument_n.disable()
+        self.assertTrue(instrument_n.is_enabled())
+        Rational(1) * 2
+        instrument_n.disable()
+        self.assertFalse(instrument_n.is_enabled())
+        Rational(1) * 2
+        self.assertEqual(instrument_n.snapshot()['counts']['Rational.__mul__'], 1)
+
+    def test_all_operations_counted(self):
+        # Список операций строится по классам: сравнения, сеттеры и classmethod тоже считаются
+        with instrument_n.profile() as p:
+            sorted([Rational(3, 4), Rational(1, 2), Rational(2, 3)])
+            r = Rational.from_string("1/2")
+            r.numerator = 3
+            Complex(1, 2).norm2()
+            Rational(10, 3).limit_denominator(2)
+        counts = p.snapshot['counts']
+        self.assertGreater(counts['Rational.__lt__'], 0)
+        self.assertEqual(counts['Rational.from_string'], 1)
+        self.assertEqual(counts['Rational.numerator'], 1)
+        self.assertEqual(counts['Complex.norm2'], 1)
+        self.assertEqual(counts['Rational.limit_denominator'], 1)
+        self.assertEqual(Rational.from_string("1/2"), Rational(1, 2))
+
+    def test_from_parts_in_histogram(self):
+        with instrument_n.profile() as p:
+            Rational._from_parts(2**40, 3)
+        self.assertEqual(p.snapshot['numerator_bits'], {64: 1})
+
+    def test_profile_keeps_outer_data(self):
+        instrument_n.enable()
+        Rational(1) * 2
+        with instrument_n.profile() as p:
+            Rational(1) * 3
+        self.assertEqual(p.snapshot['counts']['Rational.__mul__'], 2)
+        instrument_n.disable()
+
+    def test_results_unchanged(self):
+        with instrument_n.profile():
+            value = Complex(Rational(1, 2), 3) ** 3
+        self.assertEqual(value, Complex(Rational(1, 2), 3) ** 3)
+
+
+if __name__ == '__main__':
+    unittest.main()
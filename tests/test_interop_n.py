@@ -0,0 +1,144 @@
+import math
+import numbers
+import sys
+import unittest
+from array import array
+from fractions import Fraction
+from src.complex_n import Complex
+from src.rational_n import Rational
+from src.interop_n import (complex_from_buffer, complex_to_buffer,
+                           rational_from_buffers, rational_to_buffers)
+
+
+class TestInterop(unittest.TestCase):
+    def test_complex_builtin(self):
+        c = Complex(Rational(1, 2), Rational(-3, 4))
+        self.assertEqual(complex(c), 0.5 - 0.75j)
+        self.assertEqual(Complex.from_complex(0.5 - 0.75j), c)
+        self.assertEqual(c.imag, Rational(-3, 4))
+        self.assertEqual(c.conjugate(), Complex(Rational(1, 2), Rational(3, 4)))
+
+    def test_fraction_conversion(self):
+        # Точное преобразование без limit_denominator
+        f = Fraction(10**20 + 1, 3 * 10**19)
+        r = Rational(f)
+        self.assertEqual(r.numerator, 10**20 + 1)
+        self.assertEqual(r.denominator, 3 * 10**19)
+        self.assertEqual(Rational.from_fraction(f).to_fraction(), f)
+        self.assertEqual(Rational(1, 3) + Fraction(1, 2), Fraction(5, 6))
+        self.assertEqual(Fraction(1, 2), Rational(1, 2))
+
+    def test_int_and_index(self):
+        self.assertEqual(int(Rational(-7, 2)), -3)
+        self.assertEqual(int(Rational(7, 2)), 3)
+        self.assertEqual([10, 20, 30][Rational(4, 2)], 30)
+        with self.assertRaises(TypeError):
+            [1, 2][Rational(1, 2)]
+
+    def test_numbers_registration(self):
+        self.assertIsInstance(Rational(1, 2), numbers.Rational)
+        self.assertIsInstance(Complex(1, 2), numbers.Complex)
+
+    def test_complex_buffers(self):
+        values = [Complex(1, 2), Complex(Rational(1, 2), Rational(-1, 4))]
+        buf = complex_to_buffer(values)
+        self.assertEqual(buf.tolist(), [1.0, 2.0, 0.5, -0.25])
+        self.assertEqual(complex_from_buffer(buf), values)
+        with self.assertRaises(ValueError):
+            complex_from_buffer(array('d', [1.0]))
+        with self.assertRaises(TypeError):
+            complex_from_buffer(array('q', [1, 2]))
+
+    def test_exact_complex_round_trip(self):
+        # Импорт float64/complex128 точен, без limit_denominator
+        raw = array('d', [math.pi, 1e-7, -1 / 3, 2.0 ** -60])
+        values = complex_from_buffer(raw)
+        self.assertEqual(values[0].real, Rational(*math.pi.as_integer_ratio()))
+        self.assertEqual(complex_to_buffer(values).tolist(), raw.tolist())
+        self.assertEqual(complex(Complex.from_complex(1e-7 + 0.1j)), 1e-7 + 0.1j)
+        self.assertEqual(complex_from_buffer(raw, max_denominator=1000)[0].real, Rational(355, 113))
+
+    def test_numbers_protocol(self):
+        # Операции, которых требуют numbers.Rational и numbers.Complex
+        self.assertEqual(sum([Rational(1, 2), Rational(1, 3)]), Rational(5, 6))
+        self.assertEqual(Fraction(1, 2) + Rational(1, 3), Rational(5, 6))
+        self.assertEqual(Fraction(1, 2) - Rational(1, 3), Rational(1, 6))
+        self.assertEqual(Rational(2, 3) ** 2, Rational(4, 9))
+        self.assertEqual(Rational(2, 3) ** -2, Rational(9, 4))
+        self.assertEqual(2 ** Rational(3), Rational(8))
+        self.assertEqual(Rational(7, 2) // 2, 1)
+        self.assertEqual(Rational(-7, 2) % 3, Rational(5, 2))
+        self.assertEqual(divmod(Rational(7, 2), Rational(2, 3)), (5, Rational(1, 6)))
+        self.assertEqual(round(Rational(7, 2)), 4)
+        self.assertEqual(round(Rational(5, 2)), 2)
+        self.assertEqual(round(Rational(12345, 1000), 2), Rational(617, 50))
+        self.assertEqual((math.trunc(Rational(-7, 2)), math.floor(Rational(-7, 2)), math.ceil(Rational(-7, 2))),
+                         (-3, -4, -3))
+        self.assertEqual(1 / Rational(3), Rational(1, 3))
+        self.assertEqual(Complex(1, 2) + 1j, Complex(1, 3))
+        self.assertEqual(1j - Complex(1, 2), Complex(-1, -1))
+        self.assertEqual(sum([Complex(1, 2), Complex(3, 4)]), Complex(4, 6))
+        self.assertEqual(Complex(1, 1), 1 + 1j)
+        self.assertEqual(+Complex(1, 2), Complex(1, 2))
+
+    def test_rational_mixed_constructor(self):
+        # Знаменатель Fraction и float учитывается точно, а не усекается
+        self.assertEqual(Rational(Fraction(1, 2), Fraction(1, 3)), Rational(3, 2))
+        self.assertEqual(Rational(Fraction(1, 2), 3), Rational(1, 6))
+        self.assertEqual(Rational(2.0, 3), Rational(2, 3))
+        self.assertEqual(Rational(1, 1.5), Rational(2, 3))
+        self.assertEqual(Rational(Rational(1, 2), 2), Rational(1, 4))
+        self.assertEqual(Rational(1, 2) + 0.5, Rational(1))
+        with self.assertRaises(TypeError):
+            Rational(1, "2")
+
+    def test_reflected_float_matches_forward(self):
+        # Отражённые операции с float возвращают то же, что и прямые
+        a = Rational(1, 2)
+        for x in (0.5, 0.25, 3.0):
+            self.assertEqual(x + a, a + x)
+            self.assertEqual(x * a, a * x)
+            self.assertEqual(x - a, -(a - x))
+            self.assertEqual(x / a, 1 / (a / x))
+            self.assertIsInstance(x + a, Rational)
+            self.assertIsInstance(x / a, Rational)
+
+    def test_complex_equals_real(self):
+        # Complex с нулевой мнимой частью равен действительным числам любого типа
+        for value in (1, 1.0, Rational(1), Fraction(1), 1 + 0j):
+            self.assertEqual(Complex(1), value)
+            self.assertEqual(value, Complex(1))
+            self.assertFalse(Complex(1) != value)
+            self.assertNotEqual(Complex(1, 1), value)
+            self.assertNotEqual(Complex(2), value)
+        self.assertEqual(Complex(Rational(1, 2)), 0.5)
+        self.assertEqual(Complex(Rational(1, 2)), Fraction(1, 2))
+
+    def test_hash(self):
+        # Хеш совпадает с хешем равных Fraction, int, float и complex
+        for n, d in ((1, 2), (-7, 3), (5, 1), (0, 1), (2**80 + 1, 3**40), (1, sys.hash_info.modulus)):
+            self.assertEqual(hash(Rational(n, d)), hash(Fraction(n, d)))
+        self.assertEqual(hash(Rational(3)), hash(3))
+        self.assertEqual(hash(Rational(1, 4)), hash(0.25))
+        for value in (1 + 2j, -0.5 + 0.25j, 3 + 0j, -1j, 1e300 - 1e300j):
+            self.assertEqual(hash(Complex.from_complex(value)), hash(value))
+        self.assertEqual(hash(Complex(5)), hash(5))
+        self.assertEqual(len({Rational(1, 2), Fraction(1, 2), 0.5, Complex(Rational(1, 2))}), 1)
+
+    def test_rational_buffers(self):
+        values = [Rational(1, 2), Rational(-3), Rational(5, 7)]
+        nums, dens = rational_to_buffers(values)
+        self.assertEqual(rational_from_buffers(nums, dens), values)
+        self.assertEqual(rational_from_buffers(array('i', [4, 5])), [Rational(4), Rational(5)])
+        with self.assertRaises(OverflowError):
+            rational_to_buffers([Rational(2**70)])
+        with self.assertRaises(ValueError):
+            rational_from_buffers(array('q', [1, 2]), array('q', [1]))
+
+    def test_multidimensional_buffer(self):
+        view = memoryview(array('q', [1, 2, 3, 4])).cast('B').cast('q', (2, 2))
+        self.assertEqual(rational_from_buffers(view), [Rational(i) for i in range(1, 5)])
+
+
+if __name__ == '__main__':
+    unittest.main()
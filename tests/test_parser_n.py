@@ -0,0 +1,78 @@
+import io
+import os
+import tempfile
+import unittest
+from src.complex_n import Complex
+from src.rational_n import Rational
+from src.parser_n import ParseError, iter_values, iter_batches, parse_file
+
+
+class TestParser(unittest.TestCase):
+    def test_rational_from_string(self):
+        # Разбор формата __str__ и __repr__
+        self.assertEqual(Rational.from_string("3/4"), Rational(3, 4))
+        self.assertEqual(Rational.from_string("-6/8"), Rational(-3, 4))
+        self.assertEqual(Rational.from_string("5"), Rational(5))
+        self.assertEqual(Rational.from_string("Rational(3, 4)"), Rational(3, 4))
+        with self.assertRaises(ValueError):
+            Rational.from_string("3/")
+        with self.assertRaises(ValueError):
+            Rational.from_string("1/0")
+
+    def test_complex_from_string(self):
+        self.assertEqual(Complex.from_string("1/2 - 3/4i"), Complex(Rational(1, 2), Rational(-3, 4)))
+        self.assertEqual(Complex.from_string("3/4i"), Complex(0, Rational(3, 4)))
+        self.assertEqual(Complex.from_string("-i"), Complex(0, -1))
+        self.assertEqual(Complex.from_string("7"), Complex(7))
+        self.assertEqual(Complex.from_string("Complex(real=1/2, imagine=-3/4)"),
+                         Complex(Rational(1, 2), Rational(-3, 4)))
+        with self.assertRaises(ValueError):
+            Complex.from_string("1 +")
+
+    def test_round_trip(self):
+        # Строковое представление разбирается обратно в то же число
+        values = [Complex(Rational(1, 2), Rational(-3, 4)), Complex(-5, 2), Complex(0, 1), Complex(3)]
+        for value in values:
+            self.assertEqual(Complex.from_string(str(value)), value)
+            self.assertEqual(Complex.from_string(repr(value)), value)
+
+    def test_batches(self):
+        source = io.StringIO("# header\n1 + 2i\n\n3/4\n-i\n5 - 1/2i\n")
+        batches = list(iter_batches(source, Complex, batch_size=3))
+        self.assertEqual([len(b) for b in batches], [3, 1])
+        self.assertEqual(batches[1][0], Complex(5, Rational(-1, 2)))
+
+    def test_bytes_and_rational(self):
+        values = list(iter_values([b"1/2\n", b"Rational(2, 3)\n"], Rational))
+        self.assertEqual(values, [Rational(1, 2), Rational(2, 3)])
+
+    def test_error_line_number(self):
+        with self.assertRaises(ParseError) as ctx:
+            list(iter_values(["1", "2", "oops"]))
+        self.assertEqual(ctx.exception.line_number, 3)
+        self.assertEqual(ctx.exception.line, "oops")
+
+    def test_invalid_utf8_line_number(self):
+        # Некорректная кодировка тоже сообщается с номером строки
+        with self.assertRaises(ParseError) as ctx:
+            list(iter_values([b"1\n", b"\xff\xfe\n"]))
+        self.assertEqual(ctx.exception.line_number, 2)
+
+    def test_invalid_arguments(self):
+        with self.assertRaises(ValueError):
+            list(iter_batches([], batch_size=0))
+        with self.assertRaises(TypeError):
+            list(iter_values([], kind=float))
+
+    def test_parse_file(self):
+        with tempfile.NamedTemporaryFile('w', suffix='.txt', delete=False) as f:
+            f.write("1/2 + 1/2i\n2\n")
+        try:
+            batches = list(parse_file(f.name))
+        finally:
+            os.remove(f.name)
+        self.assertEqual(batches, [[Complex(Rational(1, 2), Rational(1, 2)), Complex(2)]])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,146 @@
+import asyncio
+import json
+import os
+import tempfile
+import time
+import unittest
+from unittest import mock
+from src.complex_n import Complex
+from src.rational_n import Rational
+from src import service_n
+from src.service_n import BatchClient, BatchServer, ServiceError, evaluate_batch, prepare_job
+
+
+class TestService(unittest.TestCase):
+    def test_evaluate_batch(self):
+        requests = [('mul', ['1 + i', '1 - i']), ('add', ['1/2', '1/2i']), ('pow', ['i', '2']),
+                    ('truediv', ['1', '0'])]
+        jobs = [(op, prepare_job(op, args)[0]) for op, args in requests]
+        results = evaluate_batch(jobs)
+        self.assertEqual(results[:3], [(True, '2'), (True, '1/2 + 1/2i'), (True, '-1')])
+        self.assertFalse(results[3][0])
+        for op, args in (('nope', ['1']), ('neg', ['1', '2']), ('neg', ['oops'])):
+            with self.assertRaises(ValueError):
+                prepare_job(op, args)
+
+    def test_limits(self):
+        # Слишком большие результаты отклоняются до вычисления
+        start = time.perf_counter()
+        with self.assertRaisesRegex(ValueError, 'exponent'):
+            prepare_job('pow', ['1/3 + 1/7i', '200000'])
+        with self.assertRaisesRegex(ValueError, 'too large'):
+            prepare_job('pow', ['1/3 + 1/7i', '3000'])
+        with self.assertRaisesRegex(ValueError, 'exponent'):
+            prepare_job('pow', ['i', '-1'])
+        self.assertLess(time.perf_counter() - start, 1)
+        _, cost = prepare_job('mul', ['10', '1/3'])
+        self.assertEqual(cost, 2 * (4 + 2) + 1)
+        with self.assertRaises(ValueError):
+            prepare_job('mul', ['1', '2'], max_result_bits=4)
+
+    def test_batch_failure_keeps_server(self):
+        async def scenario():
+            async with BatchServer(batch_delay=0) as server:
+                await server.start()
+                host, port = server.address[:2]
+                async with await BatchClient.connect(host, port) as client:
+                    with mock.patch.object(service_n, 'evaluate_batch', side_effect=RuntimeError('boom')):
+                        with self.assertRaises(ServiceError) as ctx:
+                            await client.evaluate('neg', 1)
+                    self.assertIn('internal error', str(ctx.exception))
+                    return await client.evaluate('neg', 1)
+
+        self.assertEqual(asyncio.run(scenario()), '-1')
+
+    def test_tcp_round_trip(self):
+        async def scenario():
+            async with BatchServer(max_batch=64, batch_delay=0.01) as server:
+                await server.start()
+                host, port = server.address[:2]
+                async with await BatchClient.connect(host, port) as client:
+                    a = Complex(Rational(1, 2), Rational(-3, 4))
+                    results = await asyncio.gather(*[client.evaluate('add', a, Complex(k)) for k in range(50)])
+                    with self.assertRaises(ServiceError):
+                        await client.evaluate('truediv', a, 0)
+                    self.assertEqual(await client.evaluate('norm2', a), '13/16')
+                # Одновременные запросы объединяются в пакеты
+                self.assertLess(server.batches, 50)
+            return results
+
+        results = asyncio.run(scenario())
+        self.assertEqual(results[2], '5/2 - 3/4i')
+        self.assertEqual(len(results), 50)
+
+    def test_bad_request(self):
+        async def scenario():
+            async with BatchServer() as server:
+                await server.start()
+                host, port = server.address[:2]
+                reader, writer = await asyncio.open_connection(host, port)
+                writer.write(b'not json\n{"id": 5, "op": "neg", "args": ["2 - i"]}\n')
+                await writer.drain()
+                first = json.loads(await reader.readline())
+                second = json.loads(await reader.readline())
+                writer.close()
+                await writer.wait_closed()
+            return first, second
+
+        first, second = asyncio.run(scenario())
+        self.assertIn('error', first)
+        self.assertEqual(second, {'id': 5, 'result': '-2 + 1i'})
+
+    def test_connection_closed_after_eof(self):
+        # После конца потока сервер дописывает ответы и закрывает соединение
+        async def scenario():
+            async with BatchServer(batch_delay=0.01) as server:
+                await server.start()
+                host, port = server.address[:2]
+                reader, writer = await asyncio.open_connection(host, port)
+                for k in range(5):
+                    writer.write(json.dumps({'id': k, 'op': 'neg', 'args': [str(k)]}).encode() + b'\n')
+                writer.write_eof()
+                data = await reader.read()
+                writer.close()
+                await writer.wait_closed()
+                for _ in range(3):
+                    async with await BatchClient.connect(host, port) as client:
+                        await client.evaluate('neg', 1)
+                await asyncio.sleep(0.01)
+                return data, len(server._connections)
+
+        data, connections = asyncio.run(scenario())
+        answers = [json.loads(line) for line in data.splitlines()]
+        self.assertEqual(sorted(a['id'] for a in answers), list(range(5)))
+        self.assertEqual(connections, 0)
+
+    def test_backpressure_queue_bound(self):
+        async def scenario():
+            async with BatchServer(max_batch=4, max_pending=2, batch_delay=0) as server:
+                await server.start()
+                host, port = server.address[:2]
+                async with await BatchClient.connect(host, port) as client:
+                    results = await asyncio.gather(*[client.evaluate('mul', k, k) for k in range(40)])
+                self.assertGreaterEqual(server.batches, 10)
+            return results
+
+        self.assertEqual(asyncio.run(scenario()), [str(k * k) for k in range(40)])
+
+    @unittest.skipUnless(hasattr(asyncio, 'start_unix_server'), 'Unix sockets are not available')
+    def test_unix_socket_and_workers(self):
+        async def scenario(path):
+            async with BatchServer(workers=1, offload_threshold=100) as server:
+                await server.start(path=path)
+                async with await BatchClient.connect(path=path) as client:
+                    big = Complex(10**60 + 1, 10**60 - 1)
+                    result = await client.evaluate('mul', big, big)
+                self.assertEqual(server.offloaded, 1)
+            return result
+
+        with tempfile.TemporaryDirectory() as tmp:
+            result = asyncio.run(scenario(os.path.join(tmp, 'service.sock')))
+        big = Complex(10**60 + 1, 10**60 - 1)
+        self.assertEqual(result, str(big * big))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,103 @@
+import multiprocessing
+import pickle
+import unittest
+from src.complex_n import Complex
+from src.rational_n import Rational
+from src.shared_n import SharedComplexBatch
+
+
+def _consume(name, queue):
+    with SharedComplexBatch.attach(name) as batch:
+        total = Complex(0)
+        for value in batch:
+            total = total + value
+        queue.put(str(total))
+
+
+class TestShared(unittest.TestCase):
+    def setUp(self):
+        self.values = [Complex(Rational(k, k + 1), Rational(-k, 3)) for k in range(50)]
+
+    def test_pickle(self):
+        # Компактная сериализация без повторного упрощения
+        r = Rational(10**30, 3)
+        self.assertEqual(pickle.loads(pickle.dumps(r)), r)
+        c = Complex(Rational(1, 2), Rational(-3, 4))
+        restored = pickle.loads(pickle.dumps(c))
+        self.assertEqual(restored, c)
+        self.assertIsInstance(restored.real, Rational)
+        self.assertLess(len(pickle.dumps(c)), 80)
+
+    def test_round_trip(self):
+        with SharedComplexBatch.create(self.values) as batch:
+            self.assertEqual(len(batch), 50)
+            with SharedComplexBatch.attach(batch.name) as view:
+                self.assertFalse(view.owner)
+                self.assertEqual(view.to_list(), self.values)
+                self.assertEqual(view[-1], self.values[-1])
+                with self.assertRaises(IndexError):
+                    view[50]
+
+    def test_bigint(self):
+        values = [Complex(Rational(-(2**200) - 1, 3), 2**70)]
+        with SharedComplexBatch.create(values) as batch:
+            self.assertEqual(batch.to_list(), values)
+            with self.assertRaises(OverflowError):
+                batch.int64_view()
+
+    def test_int64_view(self):
+        with SharedComplexBatch.create(self.values[:3]) as batch:
+            view = batch.int64_view()
+            self.assertEqual(view.tolist()[2], [2, 3, -2, 3])
+            view.release()
+
+    def test_close_unlinks(self):
+        batch = SharedComplexBatch.create(self.values)
+        name = batch.name
+        batch.close()
+        batch.close()
+        self.assertTrue(batch.closed)
+        with self.assertRaises(FileNotFoundError):
+            SharedComplexBatch.attach(name)
+        with self.assertRaises(ValueError):
+            batch[0]
+
+    def test_close_with_live_view(self):
+        # close() не теряет сегмент, пока представление не освобождено
+        batch = SharedComplexBatch.create(self.values[:3])
+        name = batch.name
+        view = batch.int64_view()
+        with self.assertRaises(BufferError):
+            batch.close()
+        self.assertFalse(batch.closed)
+        view.release()
+        batch.close()
+        with self.assertRaises(FileNotFoundError):
+            SharedComplexBatch.attach(name)
+
+    def test_finalizer_unlinks_with_live_view(self):
+        batch = SharedComplexBatch.create(self.values[:3])
+        name = batch.name
+        view = batch.int64_view()
+        with self.assertRaises(BufferError):
+            batch._finalizer()
+        with self.assertRaises(FileNotFoundError):
+            SharedComplexBatch.attach(name)
+        view.release()
+
+    def test_other_process(self):
+        queue = multiprocessing.Queue()
+        with SharedComplexBatch.create(self.values) as batch:
+            process = multiprocessing.Process(target=_consume, args=(batch.name, queue))
+            process.start()
+            result = queue.get(timeout=30)
+            process.join(30)
+        expected = Complex(0)
+        for value in self.values:
+            expected = expected + value
+        self.assertEqual(result, str(expected))
+        self.assertEqual(process.exitcode, 0)
+
+
+if __name__ == '__main__':
+    unittest.main()
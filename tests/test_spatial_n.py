@@ -0,0 +1,87 @@
+import math
+import random
+import unittest
+from src.complex_n import Complex
+from src.rational_n import Rational
+from src.spatial_n import ArgKey, KDTree, magnitude_key, sort_by_arg, sort_by_magnitude
+
+
+class TestSpatial(unittest.TestCase):
+    def setUp(self):
+        rng = random.Random(7)
+        self.points = [Complex(Rational(rng.randint(-50, 50), rng.randint(1, 6)),
+                               Rational(rng.randint(-50, 50), rng.randint(1, 6))) for _ in range(200)]
+
+    def test_rational_ordering(self):
+        self.assertLess(Rational(1, 3), Rational(1, 2))
+        self.assertLessEqual(Rational(2, 4), Rational(1, 2))
+        self.assertGreater(Rational(-1, 3), -1)
+        self.assertGreaterEqual(Rational(10**30 + 1, 10**30), 1)
+        self.assertLess(Rational(1, 4), 0.3)
+        self.assertEqual(sorted([Rational(3, 4), Rational(-1), Rational(1, 2)]),
+                         [Rational(-1), Rational(1, 2), Rational(3, 4)])
+
+    def test_norm2(self):
+        self.assertEqual(Complex(Rational(1, 2), Rational(-3, 4)).norm2(), Rational(13, 16))
+
+    def test_magnitude_ties_are_exact(self):
+        # Модули 5 и 5: равные ключи, порядок сохраняется
+        a, b, c = Complex(3, 4), Complex(5, 0), Complex(Rational(9, 2), 2)
+        self.assertEqual(magnitude_key(a), magnitude_key(b))
+        self.assertEqual(sort_by_magnitude([b, c, a]), [c, b, a])
+
+    def test_sort_by_magnitude(self):
+        result = sort_by_magnitude(self.points)
+        norms = [p.norm2() for p in result]
+        self.assertEqual(norms, sorted(norms))
+
+    def test_arg_key_matches_atan2(self):
+        points = self.points + [Complex(0), Complex(-1), Complex(2), Complex(0, -1), Complex(0, 3)]
+        result = sort_by_arg(points)
+        args = [p.arg() for p in result]
+        for a, b in zip(args, args[1:]):
+            self.assertLessEqual(a, b + 1e-12)
+        self.assertEqual(ArgKey(Complex(1, 1)), ArgKey(Complex(Rational(7, 3), Rational(7, 3))))
+        self.assertLess(ArgKey(Complex(1, -1)), ArgKey(Complex(0)))
+        self.assertLess(ArgKey(Complex(-1, 1)), ArgKey(Complex(-1)))
+
+    def test_knn_matches_brute_force(self):
+        tree = KDTree(self.points)
+        for query in (Complex(0), Complex(Rational(7, 3), -11), Complex(100, 100)):
+            brute = sorted(((p - query).norm2(), i) for i, p in enumerate(self.points))
+            result = tree.knn(query, 5)
+            self.assertEqual([(i, d) for d, i in brute[:5]], result)
+            self.assertEqual(tree.nearest(query), result[0])
+
+    def test_within_radius(self):
+        tree = KDTree(self.points)
+        query = Complex(1, Rational(1, 2))
+        radius = Rational(15, 2)
+        expected = [i for i, p in enumerate(self.points) if (p - query).norm2() <= radius * radius]
+        self.assertEqual(tree.within_radius(query, radius), expected)
+        self.assertEqual(tree.within_radius(Complex(3, 4), 0), [])
+        boundary = KDTree([Complex(3, 4), Complex(0)])
+        self.assertEqual(boundary.within_radius(Complex(0), 5), [0, 1])
+        with self.assertRaises(ValueError):
+            tree.within_radius(query, -1)
+
+    def test_exact_rational_results(self):
+        # Ключи и расстояния — Rational; float-радиус переносится точно
+        self.assertIsInstance(magnitude_key(self.points[0]), Rational)
+        tree = KDTree(self.points)
+        _, dist2 = tree.nearest(Complex(Rational(1, 3), Rational(-2, 7)))
+        self.assertIsInstance(dist2, Rational)
+        query = Complex(1, Rational(1, 2))
+        self.assertEqual(tree.within_radius(query, 7.5), tree.within_radius(query, Rational(15, 2)))
+
+    def test_empty_tree(self):
+        tree = KDTree([])
+        self.assertEqual(len(tree), 0)
+        with self.assertRaises(ValueError):
+            tree.nearest(Complex(0))
+        with self.assertRaises(ValueError):
+            tree.knn(Complex(0), 0)
+
+
+if __name__ == '__main__':
+    unittest.main()